@@ -157,6 +157,8 @@ else:
     from .actor import FB_OT_Actor, FB_OT_CameraActor
 
     from .utils.icons import FBIcons
+    from .utils.image_groups import FBImageGroups
+    from .utils import proxy
 
     CLASSES_TO_REGISTER = (MESH_OT_FBAddHead,
                            FBExifItem,
@@ -204,6 +206,12 @@ else:
         FBIcons.register()
         logger.debug("ICONS REGISTERED")
 
+        FBImageGroups.register_handlers()
+        logger.debug("IMAGE GROUPS HANDLERS REGISTERED")
+
+        proxy.register_handlers()
+        logger.debug("PROXY HANDLERS REGISTERED")
+
 
     def unregister():
         logger = logging.getLogger(__name__)
@@ -219,6 +227,12 @@ else:
         FBIcons.unregister()
         logger.debug("ICONS UNREGISTERED")
 
+        FBImageGroups.unregister_handlers()
+        logger.debug("IMAGE GROUPS HANDLERS UNREGISTERED")
+
+        proxy.unregister_handlers()
+        logger.debug("PROXY HANDLERS UNREGISTERED")
+
 
 if __name__ == "__main__":
     register()
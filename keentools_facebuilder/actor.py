@@ -28,7 +28,10 @@ from .utils import manipulate
 from .config import Config, get_main_settings, get_operators, ErrorType
 from .utils.exif_reader import (update_image_groups,
                                 auto_setup_camera_from_exif,
-                                is_size_compatible_with_group)
+                                is_size_compatible_with_group,
+                                update_camera_image_group,
+                                set_camera_image_group,
+                                new_image_group_num)
 
 
 class FB_OT_Actor(bpy.types.Operator):
@@ -91,20 +94,18 @@ class FB_OT_CameraActor(bpy.types.Operator):
             head.smart_mode_toggle()
 
         elif self.action == 'reset_image_group':
-            camera.image_group = 0
-            update_image_groups(head)
+            update_camera_image_group(head, settings.current_camnum,
+                                      reset=True)
 
         elif self.action == 'new_image_group':
-            groups = [x.image_group for x in head.cameras if x.image_group > 0]
-            if len(groups) > 0:
-                camera.image_group = max(groups) + 1
-            else:
-                camera.image_group = 1
+            set_camera_image_group(head, settings.current_camnum,
+                                   new_image_group_num(head))
             head.show_image_groups = True
 
         elif self.action == 'to_image_group':
             if is_size_compatible_with_group(head, camera, self.num):
-                camera.image_group = self.num
+                set_camera_image_group(head, settings.current_camnum,
+                                       self.num)
                 head.show_image_groups = True
             else:
                 error_message = "Wrong Image Size\n\n" \
@@ -117,7 +118,7 @@ class FB_OT_CameraActor(bpy.types.Operator):
                      msg_content=error_message)
 
         elif self.action == 'make_unique':
-            camera.image_group = -1
+            set_camera_image_group(head, settings.current_camnum, -1)
             head.show_image_groups = True
 
         elif self.action == 'make_all_unique':
@@ -130,9 +131,9 @@ class FB_OT_CameraActor(bpy.types.Operator):
             update_image_groups(head)
 
         elif self.action == 'settings_by_exif':
-            camera.image_group = 0
             auto_setup_camera_from_exif(camera)
-            update_image_groups(head)
+            update_camera_image_group(head, settings.current_camnum,
+                                      reset=True)
 
         elif self.action == 'reset_all_camera_settings':
             for camera in head.cameras:
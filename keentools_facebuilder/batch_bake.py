@@ -0,0 +1,205 @@
+# ##### BEGIN GPL LICENSE BLOCK #####
+# KeenTools for blender is a blender addon for using KeenTools in Blender.
+# Copyright (C) 2019  KeenTools
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+# ##### END GPL LICENSE BLOCK #####
+
+
+""" Headless batch texture baking.
+Start it from command line:
+blender -b -P /full_path_to/batch_bake.py -- [--jobs N] [--out-dir DIR]
+    [--report report.json] file1.blend file2.blend:0,2 ...
+Every .blend file (or listed heads of it) is baked in a separate
+background Blender process, textures are saved to disk """
+import argparse
+import json
+import logging
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import bpy
+
+from keentools_facebuilder.config import Config, get_main_settings
+from keentools_facebuilder.utils import materials
+
+
+def _parse_spec(spec):
+    """ 'file.blend:0,2' -> ('file.blend', [0, 2]), all heads if None """
+    path, sep, heads = spec.rpartition(':')
+    if sep and path.lower().endswith('.blend') and heads:
+        return os.path.abspath(path), [int(x) for x in heads.split(',')]
+    return os.path.abspath(spec), None
+
+
+def _texture_path(out_dir, blend_path, head_name, file_format):
+    ext = '.exr' if file_format == 'OPEN_EXR' else '.png'
+    name = '{}_{}{}'.format(
+        os.path.splitext(os.path.basename(blend_path))[0],
+        bpy.path.clean_name(head_name), ext)
+    return os.path.join(out_dir, name)
+
+
+# --------
+# Worker side: runs inside Blender with opened .blend file
+def _bake_heads(headnums, out_dir, file_format):
+    settings = get_main_settings()
+    if headnums is None:
+        headnums = list(range(len(settings.heads)))
+
+    results = []
+    for headnum in headnums:
+        head = settings.get_head(headnum)
+        res = {'file': bpy.data.filepath, 'headnum': headnum,
+               'head': None, 'status': 'failed', 'texture': None,
+               'time': 0.0, 'error': None}
+        results.append(res)
+        if head is None or head.headobj is None:
+            res['error'] = 'No head with this number'
+            continue
+        res['head'] = head.headobj.name
+        filepath = _texture_path(out_dir, bpy.data.filepath,
+                                 head.headobj.name, file_format)
+        start = time.perf_counter()
+        try:
+            if materials.bake_tex(headnum, Config.tex_builder_filename,
+                                  filepath=filepath):
+                res['status'] = 'ok'
+                res['texture'] = filepath
+            else:
+                res['status'] = 'skipped'
+                res['error'] = 'No frames for texture building'
+        except Exception as err:
+            res['error'] = '{}: {}'.format(type(err).__name__, str(err))
+        res['time'] = time.perf_counter() - start
+    return results
+
+
+def _worker_main(args):
+    out_dir = args.out_dir if args.out_dir else \
+        os.path.dirname(bpy.data.filepath)
+    os.makedirs(out_dir, exist_ok=True)
+    results = _bake_heads(args.heads, out_dir, args.file_format)
+    with open(args.result, 'w') as f:
+        json.dump(results, f)
+
+
+# --------
+# Coordinator side: starts worker processes
+def _run_job(spec, args, tmp_dir, job_num):
+    blend_path, headnums = _parse_spec(spec)
+    result_path = os.path.join(tmp_dir, 'job_{}.json'.format(job_num))
+    cmd = [bpy.app.binary_path, '-b', blend_path,
+           '--addons', Config.addon_name,
+           '-P', os.path.abspath(__file__), '--',
+           '--worker', '--result', result_path,
+           '--file-format', args.file_format]
+    if args.out_dir:
+        cmd += ['--out-dir', os.path.abspath(args.out_dir)]
+    if headnums is not None:
+        cmd += ['--heads', ','.join(str(x) for x in headnums)]
+
+    start = time.perf_counter()
+    try:
+        proc = subprocess.run(cmd, stdout=subprocess.PIPE,
+                              stderr=subprocess.STDOUT,
+                              timeout=args.timeout)
+        output = proc.stdout.decode('utf-8', errors='replace')
+        returncode = proc.returncode
+    except subprocess.TimeoutExpired:
+        output = 'Timeout'
+        returncode = None
+    elapsed = time.perf_counter() - start
+
+    if os.path.exists(result_path):
+        with open(result_path) as f:
+            results = json.load(f)
+    else:
+        # Worker has crashed before result was written
+        results = [{'file': blend_path, 'headnum': headnums, 'head': None,
+                    'status': 'failed', 'texture': None, 'time': elapsed,
+                    'error': output[-2000:]}]
+    return {'spec': spec, 'returncode': returncode,
+            'time': elapsed, 'heads': results}
+
+
+def _coordinator_main(args):
+    logger = logging.getLogger(__name__)
+    start = time.perf_counter()
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        with ThreadPoolExecutor(max_workers=max(1, args.jobs)) as executor:
+            futures = [executor.submit(_run_job, spec, args, tmp_dir, i)
+                       for i, spec in enumerate(args.files)]
+            jobs = [future.result() for future in futures]
+
+    heads = [res for job in jobs for res in job['heads']]
+    report = {
+        'jobs': args.jobs,
+        'time': time.perf_counter() - start,
+        'baked': sum(1 for res in heads if res['status'] == 'ok'),
+        'failed': sum(1 for res in heads if res['status'] == 'failed'),
+        'skipped': sum(1 for res in heads if res['status'] == 'skipped'),
+        'files': jobs,
+    }
+    report_text = json.dumps(report, indent=2)
+    if args.report:
+        with open(args.report, 'w') as f:
+            f.write(report_text)
+    else:
+        print(report_text)
+    logger.info('BATCH BAKE: {} BAKED, {} FAILED, {} SKIPPED'.format(
+        report['baked'], report['failed'], report['skipped']))
+    return report
+
+
+def _parse_args(argv):
+    parser = argparse.ArgumentParser(
+        prog='batch_bake', description='FaceBuilder batch texture baking')
+    parser.add_argument('files', nargs='*',
+                        help='.blend files, heads can be selected '
+                             'as file.blend:0,2')
+    parser.add_argument('--jobs', type=int,
+                        default=Config.batch_bake_jobs,
+                        help='Number of Blender processes at once')
+    parser.add_argument('--out-dir', default=None,
+                        help='Textures directory, next to .blend by default')
+    parser.add_argument('--file-format', default='PNG',
+                        choices=['PNG', 'OPEN_EXR'])
+    parser.add_argument('--report', default=None,
+                        help='JSON report path, printed if not set')
+    parser.add_argument('--timeout', type=float, default=None,
+                        help='Time limit for one .blend file in seconds')
+    # Worker process arguments
+    parser.add_argument('--worker', action='store_true',
+                        help=argparse.SUPPRESS)
+    parser.add_argument('--result', help=argparse.SUPPRESS)
+    parser.add_argument('--heads', default=None, help=argparse.SUPPRESS,
+                        type=lambda x: [int(h) for h in x.split(',')])
+    return parser.parse_args(argv)
+
+
+def main(argv):
+    args = _parse_args(argv)
+    if args.worker:
+        _worker_main(args)
+    else:
+        _coordinator_main(args)
+
+
+if __name__ == '__main__':
+    main(sys.argv[sys.argv.index('--') + 1:] if '--' in sys.argv else [])
@@ -16,12 +16,11 @@ def increment_base(data, base):
     return ord_(data[base + 2]) * 256 + ord_(data[base + 3]) + 2
 
 
-def process_file(f, stop_tag=DEFAULT_STOP_TAG, details=True, strict=False, debug=False):
+def _find_exif_header(f):
     """
-    Process an image file (expects an open file object).
+    Find EXIF data in JPEG or TIFF file (expects an open file object).
 
-    This is the function that has to deal with all the arbitrary nasty bits
-    of the EXIF standard.
+    Returns (endian, offset, fake_exif) or None if there is no EXIF.
     """
 
     # by default do not fake an EXIF beginning
@@ -146,7 +145,7 @@ def process_file(f, stop_tag=DEFAULT_STOP_TAG, details=True, strict=False, debug
                                  ord_(data[base + 1]))
                 except IndexError:
                     logger.debug("  Unexpected/unhandled segment type or file content.")
-                    return {}
+                    return None
                 else:
                     logger.debug("  Increment base by %s", increment)
                     base += increment
@@ -173,13 +172,27 @@ def process_file(f, stop_tag=DEFAULT_STOP_TAG, details=True, strict=False, debug
             logger.debug("No EXIF header expected data[2+base]==0xFF and data[6+base:10+base]===Exif (or Duck)")
             logger.debug("Did get 0x%X and %s",
                          ord_(data[2 + base]), data[6 + base:10 + base + 1])
-            return {}
+            return None
     else:
         # file format not recognized
         logger.debug("File format not recognized.")
+        return None
+
+    return chr(ord_(endian[0])), offset, fake_exif
+
+
+def process_file(f, stop_tag=DEFAULT_STOP_TAG, details=True, strict=False, debug=False):
+    """
+    Process an image file (expects an open file object).
+
+    This is the function that has to deal with all the arbitrary nasty bits
+    of the EXIF standard.
+    """
+    header = _find_exif_header(f)
+    if header is None:
         return {}
+    endian, offset, fake_exif = header
 
-    endian = chr(ord_(endian[0]))
     # deal with the EXIF info we found
     logger.debug("Endian format is %s (%s)", endian, {
         'I': 'Intel',
@@ -260,3 +273,28 @@ def process_file(f, stop_tag=DEFAULT_STOP_TAG, details=True, strict=False, debug
             hdr.parse_xmp(xmp_string)
 
     return hdr.tags
+
+
+def process_file_tags(f, tag_names, strict=False):
+    """
+    Fast path: read only requested tags (like 'EXIF FocalLength')
+    from IFD0 and EXIF SubIFD (expects an open file object).
+
+    Stops as soon as all requested tags are found.
+    Maker notes, thumbnails and other IFDs are never processed.
+    """
+    header = _find_exif_header(f)
+    if header is None:
+        return {}
+    endian, offset, fake_exif = header
+
+    wanted = set(tag_names)
+    hdr = ExifHeader(f, endian, offset, fake_exif, strict, False, False)
+    ifd = hdr._first_ifd()
+    if ifd:
+        hdr.dump_ifd(ifd, 'Image', tag_filter=wanted | {'Image ExifOffset'})
+    exif_off = hdr.tags.get('Image ExifOffset')
+    if exif_off and not wanted.issubset(hdr.tags.keys()):
+        logger.debug('Exif SubIFD at offset %s:', exif_off.values[0])
+        hdr.dump_ifd(exif_off.values[0], 'EXIF', tag_filter=wanted)
+    return {name: tag for name, tag in hdr.tags.items() if name in wanted}
@@ -116,9 +116,13 @@ class ExifHeader:
             i = self._next_ifd(i)
         return ifds
 
-    def dump_ifd(self, ifd, ifd_name, tag_dict=EXIF_TAGS, relative=0, stop_tag=DEFAULT_STOP_TAG):
+    def dump_ifd(self, ifd, ifd_name, tag_dict=EXIF_TAGS, relative=0, stop_tag=DEFAULT_STOP_TAG,
+                 tag_filter=None):
         """
         Return a list of entries in the given IFD.
+
+        If tag_filter (set of full tag names) is given, other tags are not
+        decoded and processing stops when all of them are found.
         """
         # make sure we can process the entries
         try:
@@ -139,6 +143,10 @@ class ExifHeader:
             else:
                 tag_name = 'Tag 0x%04X' % tag
 
+            # skip tags which are not requested
+            if tag_filter is not None and ifd_name + ' ' + tag_name not in tag_filter:
+                continue
+
             # ignore certain tags for faster processing
             if not (not self.detailed and tag in IGNORE_TAGS):
                 field_type = self.s2n(entry + 2, 2)
@@ -266,6 +274,9 @@ class ExifHeader:
                     tag_value = unicode(self.tags[ifd_name + ' ' + tag_name])
                 logger.debug(' %s: %s', tag_name, tag_value)
 
+                if tag_filter is not None and tag_filter.issubset(self.tags.keys()):
+                    return
+
             if tag_name == stop_tag:
                 break
 
@@ -0,0 +1,230 @@
+# ##### BEGIN GPL LICENSE BLOCK #####
+# KeenTools for blender is a blender addon for using KeenTools in Blender.
+# Copyright (C) 2019  KeenTools
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+# ##### END GPL LICENSE BLOCK #####
+
+
+"""
+Image dimensions and EXIF orientation from file header only,
+without pixels decoding. JPEG, PNG, TIFF, OpenEXR and BMP are supported.
+"""
+
+import os
+import struct
+import threading
+from collections import OrderedDict, namedtuple
+
+
+__all__ = ['ImageInfo', 'read_image_info', 'probe_image', 'clear_cache']
+
+
+ImageInfo = namedtuple('ImageInfo', ['width', 'height', 'orientation'])
+
+_CACHE_MAX_ENTRIES = 4096
+_cache = OrderedDict()
+_cache_lock = threading.Lock()
+
+# JPEG Start Of Frame markers (all but DHT, JPG and DAC)
+_JPEG_SOF_MARKERS = {0xC0, 0xC1, 0xC2, 0xC3, 0xC5, 0xC6, 0xC7,
+                     0xC9, 0xCA, 0xCB, 0xCD, 0xCE, 0xCF}
+# Markers without length field
+_JPEG_STANDALONE_MARKERS = {0x01, 0xD8} | set(range(0xD0, 0xD8))
+_JPEG_SOS = 0xDA
+
+_TIFF_IMAGE_WIDTH = 0x0100
+_TIFF_IMAGE_LENGTH = 0x0101
+_TIFF_ORIENTATION = 0x0112
+_TIFF_SHORT = 3
+_TIFF_LONG = 4
+
+_EXR_MAGIC = b'\x76\x2f\x31\x01'
+_PNG_SIGNATURE = b'\x89PNG\r\n\x1a\n'
+
+
+def _read_exact(f, size):
+    data = f.read(size)
+    if len(data) != size:
+        raise EOFError
+    return data
+
+
+def _tiff_info(f, base):
+    """ Size and orientation from the first IFD of TIFF structure
+    starting at base file offset """
+    f.seek(base)
+    header = _read_exact(f, 8)
+    if header[:4] == b'II*\x00':
+        endian = '<'
+    elif header[:4] == b'MM\x00*':
+        endian = '>'
+    else:
+        return None
+    ifd_offset, = struct.unpack(endian + 'I', header[4:])
+    f.seek(base + ifd_offset)
+    count, = struct.unpack(endian + 'H', _read_exact(f, 2))
+    entries = _read_exact(f, 12 * count)
+    values = {}
+    for i in range(count):
+        tag, field_type, _ = struct.unpack_from(endian + 'HHI', entries, 12 * i)
+        if tag not in (_TIFF_IMAGE_WIDTH, _TIFF_IMAGE_LENGTH,
+                       _TIFF_ORIENTATION):
+            continue
+        if field_type == _TIFF_SHORT:
+            value, = struct.unpack_from(endian + 'H', entries, 12 * i + 8)
+        elif field_type == _TIFF_LONG:
+            value, = struct.unpack_from(endian + 'I', entries, 12 * i + 8)
+        else:
+            continue
+        values[tag] = value
+    return values
+
+
+def _read_tiff(f):
+    values = _tiff_info(f, 0)
+    if not values or _TIFF_IMAGE_WIDTH not in values or \
+            _TIFF_IMAGE_LENGTH not in values:
+        return None
+    return ImageInfo(values[_TIFF_IMAGE_WIDTH], values[_TIFF_IMAGE_LENGTH],
+                     values.get(_TIFF_ORIENTATION, 1))
+
+
+def _read_jpeg(f):
+    orientation = 1
+    f.seek(2)
+    while True:
+        # Markers can be padded with any number of 0xFF
+        byte = _read_exact(f, 1)
+        if byte != b'\xff':
+            return None
+        while byte == b'\xff':
+            byte = _read_exact(f, 1)
+        marker = byte[0]
+        if marker in _JPEG_STANDALONE_MARKERS:
+            continue
+        if marker == _JPEG_SOS:
+            return None
+        length, = struct.unpack('>H', _read_exact(f, 2))
+        start = f.tell()
+        if marker in _JPEG_SOF_MARKERS:
+            _, height, width = struct.unpack('>BHH', _read_exact(f, 5))
+            return ImageInfo(width, height, orientation)
+        if marker == 0xE1 and length >= 16 and \
+                _read_exact(f, 6) == b'Exif\x00\x00':
+            try:
+                values = _tiff_info(f, start + 6)
+            except (EOFError, struct.error):
+                values = None
+            if values:
+                orientation = values.get(_TIFF_ORIENTATION, orientation)
+        f.seek(start + length - 2)
+
+
+def _read_png(f):
+    f.seek(8)
+    _, chunk_type, width, height = struct.unpack('>I4sII', _read_exact(f, 16))
+    if chunk_type != b'IHDR':
+        return None
+    return ImageInfo(width, height, 1)
+
+
+def _read_exr(f):
+    f.seek(8)
+    while True:
+        name = _read_zstring(f)
+        if not name:  # End of header
+            return None
+        attr_type = _read_zstring(f)
+        size, = struct.unpack('<i', _read_exact(f, 4))
+        if name == b'dataWindow' and attr_type == b'box2i':
+            xmin, ymin, xmax, ymax = struct.unpack('<4i', _read_exact(f, 16))
+            return ImageInfo(xmax - xmin + 1, ymax - ymin + 1, 1)
+        f.seek(size, os.SEEK_CUR)
+
+
+def _read_zstring(f, max_len=256):
+    res = bytearray()
+    while len(res) < max_len:
+        byte = _read_exact(f, 1)
+        if byte == b'\x00':
+            return bytes(res)
+        res += byte
+    raise EOFError
+
+
+def _read_bmp(f):
+    f.seek(14)
+    header_size, = struct.unpack('<I', _read_exact(f, 4))
+    if header_size == 12:  # OS/2 BITMAPCOREHEADER
+        width, height = struct.unpack('<HH', _read_exact(f, 4))
+    else:
+        width, height = struct.unpack('<ii', _read_exact(f, 8))
+    return ImageInfo(width, abs(height), 1)
+
+
+def read_image_info(f):
+    """ ImageInfo from binary file object or None for unknown format """
+    f.seek(0)
+    magic = f.read(8)
+    try:
+        if magic[:2] == b'\xff\xd8':
+            return _read_jpeg(f)
+        if magic == _PNG_SIGNATURE:
+            return _read_png(f)
+        if magic[:4] in (b'II*\x00', b'MM\x00*'):
+            return _read_tiff(f)
+        if magic[:4] == _EXR_MAGIC:
+            return _read_exr(f)
+        if magic[:2] == b'BM':
+            return _read_bmp(f)
+    except (EOFError, struct.error):
+        pass
+    return None
+
+
+def _file_key(filepath):
+    path = os.path.normcase(os.path.abspath(filepath))
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return path, stat.st_size, stat.st_mtime_ns
+
+
+def probe_image(filepath):
+    """ ImageInfo of image file or None. Results are cached by
+    (path, size, modification time), safe to call from threads """
+    key = _file_key(filepath)
+    if key is None:
+        return None
+    with _cache_lock:
+        if key in _cache:
+            _cache.move_to_end(key)
+            return _cache[key]
+    try:
+        with open(key[0], 'rb') as f:
+            info = read_image_info(f)
+    except OSError:
+        return None
+    with _cache_lock:
+        _cache[key] = info
+        while len(_cache) > _CACHE_MAX_ENTRIES:
+            _cache.popitem(last=False)
+    return info
+
+
+def clear_cache():
+    with _cache_lock:
+        _cache.clear()
@@ -0,0 +1,61 @@
+# ##### BEGIN GPL LICENSE BLOCK #####
+# KeenTools for blender is a blender addon for using KeenTools in Blender.
+# Copyright (C) 2019  KeenTools
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+# ##### END GPL LICENSE BLOCK #####
+
+import os
+
+import pytest
+import keentools_facebuilder.blender_independent_packages.exifread as exifread
+
+
+_IMAGES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                           '..', '..', '..', 'tests', 'images')
+
+_TAGS = ['EXIF FocalLength', 'EXIF FocalLengthIn35mmFilm',
+         'EXIF FocalPlaneXResolution', 'EXIF FocalPlaneYResolution',
+         'EXIF FocalPlaneResolutionUnit',
+         'EXIF ExifImageWidth', 'EXIF ExifImageLength',
+         'Image ImageWidth', 'Image ImageLength',
+         'Image Orientation', 'Image Make', 'Image Model']
+
+
+def _image_files():
+    return sorted(os.path.join(_IMAGES_DIR, name)
+                  for name in os.listdir(_IMAGES_DIR))
+
+
+def _tag_info(tag):
+    return (tag.printable, tag.tag, tag.field_type,
+            str(tag.values), tag.field_offset, tag.field_length)
+
+
+@pytest.mark.parametrize('filepath', _image_files())
+def test_tags_parity(filepath):
+    with open(filepath, 'rb') as f:
+        full = exifread.process_file(f, details=True)
+    with open(filepath, 'rb') as f:
+        fast = exifread.process_file_tags(f, _TAGS)
+
+    expected = {name: _tag_info(tag) for name, tag in full.items()
+                if name in _TAGS}
+    assert({name: _tag_info(tag) for name, tag in fast.items()} == expected)
+
+
+def test_no_extra_tags():
+    with open(os.path.join(_IMAGES_DIR, 'ale_white_24x16.jpg'), 'rb') as f:
+        fast = exifread.process_file_tags(f, ['Image Make'])
+    assert(list(fast.keys()) == ['Image Make'])
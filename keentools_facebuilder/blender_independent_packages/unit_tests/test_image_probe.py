@@ -0,0 +1,131 @@
+# ##### BEGIN GPL LICENSE BLOCK #####
+# KeenTools for blender is a blender addon for using KeenTools in Blender.
+# Copyright (C) 2019  KeenTools
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+# ##### END GPL LICENSE BLOCK #####
+
+
+import io
+import os
+import re
+import struct
+import zlib
+
+import pytest
+import keentools_facebuilder.blender_independent_packages.image_probe as image_probe
+
+
+_IMAGES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                           '..', '..', '..', 'tests', 'images')
+
+
+def _sample_images():
+    """ Pixel size is a part of test image name """
+    res = []
+    for name in sorted(os.listdir(_IMAGES_DIR)):
+        match = re.search(r'_(\d+)x(\d+)\.', name)
+        if match:
+            res.append((name, int(match.group(1)), int(match.group(2))))
+    return res
+
+
+@pytest.mark.parametrize('name,width,height', _sample_images())
+def test_sample_images(name, width, height):
+    info = image_probe.probe_image(os.path.join(_IMAGES_DIR, name))
+    assert (info.width, info.height, info.orientation) == (width, height, 1)
+
+
+def test_not_an_image():
+    assert image_probe.probe_image(os.path.join(_IMAGES_DIR, 'zero.jpg')) \
+        is None
+    assert image_probe.probe_image(
+        os.path.join(_IMAGES_DIR, 'missing.jpg')) is None
+
+
+def _tiff_ifd(endian, entries):
+    res = struct.pack(endian + 'H', len(entries))
+    for tag, field_type, value in entries:
+        # SHORT value is padded to 4 bytes
+        value_bytes = struct.pack(endian + 'HH', value, 0) \
+            if field_type == 3 else struct.pack(endian + 'I', value)
+        res += struct.pack(endian + 'HHI', tag, field_type, 1) + value_bytes
+    return res + b'\x00\x00\x00\x00'
+
+
+def _tiff(endian, entries):
+    magic = b'II*\x00' if endian == '<' else b'MM\x00*'
+    return magic + struct.pack(endian + 'I', 8) + _tiff_ifd(endian, entries)
+
+
+def _jpeg(width, height, orientation):
+    exif = b'Exif\x00\x00' + _tiff('>', [(0x0112, 3, orientation)])
+    app1 = b'\xff\xe1' + struct.pack('>H', len(exif) + 2) + exif
+    app0 = b'\xff\xe0' + struct.pack('>H', 16) + b'JFIF\x00' + bytes(9)
+    sof2 = b'\xff\xc2' + struct.pack('>HBHHB', 11, 8, height, width, 1) + \
+        bytes(3)
+    return b'\xff\xd8' + app0 + app1 + b'\xff' + sof2 + b'\xff\xda'
+
+
+def _png(width, height):
+    ihdr = struct.pack('>IIBBBBB', width, height, 8, 6, 0, 0, 0)
+    return b'\x89PNG\r\n\x1a\n' + struct.pack('>I', len(ihdr)) + b'IHDR' + \
+        ihdr + struct.pack('>I', zlib.crc32(b'IHDR' + ihdr))
+
+
+def _exr_attr(name, attr_type, value):
+    return name + b'\x00' + attr_type + b'\x00' + \
+        struct.pack('<i', len(value)) + value
+
+
+def _exr(width, height):
+    return b'\x76\x2f\x31\x01' + struct.pack('<I', 2) + \
+        _exr_attr(b'compression', b'compression', b'\x00') + \
+        _exr_attr(b'dataWindow', b'box2i',
+                  struct.pack('<4i', 10, 20, 10 + width - 1, 20 + height - 1)) + \
+        b'\x00'
+
+
+def _bmp(width, height):
+    return b'BM' + bytes(12) + struct.pack('<Iii', 40, width, height)
+
+
+@pytest.mark.parametrize('data,expected', [
+    (_jpeg(4000, 3000, 6), (4000, 3000, 6)),
+    (_png(1920, 1080), (1920, 1080, 1)),
+    (_tiff('<', [(0x0100, 4, 6000), (0x0101, 3, 4000),
+                 (0x0112, 3, 8)]), (6000, 4000, 8)),
+    (_tiff('>', [(0x0100, 3, 640), (0x0101, 3, 480)]), (640, 480, 1)),
+    (_exr(2048, 1536), (2048, 1536, 1)),
+    (_bmp(800, -600), (800, 600, 1)),
+])
+def test_headers(data, expected):
+    info = image_probe.read_image_info(io.BytesIO(data))
+    assert tuple(info) == expected
+
+
+def test_truncated_header():
+    data = _jpeg(4000, 3000, 6)
+    assert image_probe.read_image_info(io.BytesIO(data[:40])) is None
+
+
+def test_cache(tmp_path):
+    image_probe.clear_cache()
+    filepath = str(tmp_path / 'image.png')
+    with open(filepath, 'wb') as f:
+        f.write(_png(100, 50))
+    assert image_probe.probe_image(filepath) == (100, 50, 1)
+    with open(filepath, 'wb') as f:
+        f.write(_png(200, 100) + b'\x00')  # File size is changed
+    assert image_probe.probe_image(filepath) == (200, 100, 1)
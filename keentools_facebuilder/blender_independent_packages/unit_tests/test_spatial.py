@@ -0,0 +1,75 @@
+# ##### BEGIN GPL LICENSE BLOCK #####
+# KeenTools for blender is a blender addon for using KeenTools in Blender.
+# Copyright (C) 2019  KeenTools
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+# ##### END GPL LICENSE BLOCK #####
+
+
+import numpy as np
+import pytest
+from keentools_facebuilder.utils.spatial import FBPointsGrid
+
+
+def _brute_force_nearest(points, x, y, dist2):
+    if len(points) == 0:
+        return -1, dist2
+    d2 = (points[:, 0] - x) ** 2 + (points[:, 1] - y) ** 2
+    nearest = int(np.argmin(d2))
+    if d2[nearest] < dist2:
+        return nearest, float(d2[nearest])
+    return -1, dist2
+
+
+def _check_queries(points, cell_size, queries, radius):
+    grid = FBPointsGrid(points, cell_size)
+    for x, y in queries:
+        expected = _brute_force_nearest(grid.points, x, y, radius ** 2)
+        res = grid.nearest(x, y, radius ** 2)
+        # Equal distances may give another index
+        assert res[1] == expected[1]
+        assert (res[0] < 0) == (expected[0] < 0)
+
+
+@pytest.mark.parametrize('radius', [0.001, 0.02, 0.05, 0.3, 5.0])
+def test_random_points(radius):
+    rng = np.random.RandomState(42)
+    points = rng.uniform(-1.0, 1.0, (500, 2)).astype(np.float32)
+    queries = rng.uniform(-1.2, 1.2, (200, 2)).tolist()
+    # Queries exactly at points
+    queries += points[:50].tolist()
+    _check_queries(points, 0.05, queries, radius)
+
+
+@pytest.mark.parametrize('radius', [0.1, 0.25, 0.5])
+def test_cell_boundary_points(radius):
+    cell_size = 0.25
+    coords = np.arange(-4, 5) * cell_size
+    points = np.array([(x, y) for x in coords for y in coords],
+                      dtype=np.float32)
+    queries = [(x + dx, y + dy) for x in coords[::2] for y in coords[::3]
+               for dx, dy in [(0.0, 0.0), (0.05, -0.05), (-0.2, 0.1)]]
+    _check_queries(points, cell_size, queries, radius)
+
+
+def test_empty_grid():
+    grid = FBPointsGrid(np.empty((0, 2), dtype=np.float32), 0.05)
+    assert len(grid.candidates(0.0, 0.0, 1.0)) == 0
+    assert grid.nearest(0.0, 0.0, 1.0) == (-1, 1.0)
+
+
+def test_single_point():
+    grid = FBPointsGrid([(0.1, 0.1)], 0.05)
+    assert grid.nearest(0.12, 0.1, 1.0)[0] == 0
+    assert grid.nearest(0.5, 0.5, 0.01) == (-1, 0.01)
@@ -263,6 +263,9 @@ class Config:
     fb_dir_prop_name = (prefix + '_dir',)
     fb_camera_prop_name = (prefix + '_camera',)
     fb_mod_ver_prop_name = (prefix + '_mod_ver',)
+    # Binary head state in FBHeadItem and FBCameraItem
+    fb_serial_blob_name = 'serial_blob'
+    fb_model_mat_blob_name = 'model_mat_blob'
     # Save / Reconstruct parameters
     reconstruct_focal_param = ('focal',)
     reconstruct_sensor_width_param = ('sensor_width',)
@@ -277,6 +280,35 @@ class Config:
     text_scale_y = 0.75
 
     viewport_redraw_interval = 0.1
+    topology_cache_size = 8
+    # Pins count when screen pins get a grid index
+    pins_grid_threshold = 64
+    pins_grid_cell_size = 0.05  # in image space (frame width = 1.0)
+    # Texture baking frames prefetch
+    bake_prefetch_frames = 2
+    bake_prefetch_workers = 2
+    bake_prefetch_memory_limit = 1024 * 1024 * 1024  # in bytes
+    # sRGB to linear conversion
+    srgb_lut_size = 4096
+    srgb_chunk_pixels = 1024 * 1024
+    # On-disk texture bake results in system temp directory
+    bake_cache_dir_name = 'keentools_bake_cache'
+    bake_cache_max_size = 1024 * 1024 * 1024  # in bytes
+    # Downscale factors of progressive texture baking passes
+    tex_progressive_passes = (4, 1)
+    # Background Blender processes in batch texture baking
+    batch_bake_jobs = 2
+    # Persistent EXIF cache in Blender user config directory
+    exif_cache_dir = 'keentools'
+    exif_cache_filename = 'exif_cache.jsonl'
+    exif_cache_max_entries = 10000
+    # Threads reading EXIF of images selected for import
+    exif_import_workers = 4
+    # Loaded camera images memory, default of addon preferences value
+    image_memory_budget = 2048 * 1024 * 1024  # in bytes
+    # Downscaled pin mode backgrounds in system temp directory
+    proxy_dir_name = 'keentools_proxy_cache'
+    proxy_long_side = 2048
     unknown_mod_ver = -1
 
     default_focal_length = 50.0
@@ -341,6 +373,10 @@ def get_main_settings():
     return getattr(bpy.context.scene, Config.addon_global_var_name)
 
 
+def get_addon_preferences():
+    return bpy.context.preferences.addons[Config.addon_name].preferences
+
+
 def get_operators():
     return getattr(bpy.ops, Config.operators)
 
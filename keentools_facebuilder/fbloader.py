@@ -23,8 +23,11 @@ import math
 import numpy as np
 
 from .viewport import FBViewport
-from .utils import attrs, coords, cameras
+from .utils import attrs, coords, cameras, proxy
 from .utils.other import FBStopShaderTimer, restore_ui_elements
+from .utils.topology import FBMeshTopology, FBTopologyCache
+from .utils.images import image_size
+from .utils.residency import FBImageResidency
 from .utils.exif_reader import update_image_groups, reload_all_camera_exif
 
 from .config import Config, get_main_settings
@@ -120,6 +123,11 @@ class FBLoader:
         cameras.show_all_cameras(headnum)
         headobj.hide_set(False)
         settings.pinmode = False
+        FBImageResidency.unpin()
+        if settings.current_camnum >= 0:
+            camera = head.get_camera(settings.current_camnum)
+            if camera is not None:
+                proxy.restore_background(camera)
         logger.debug("OUT PINMODE")
 
     @classmethod
@@ -161,9 +169,9 @@ class FBLoader:
 
     @classmethod
     def shader_update(cls, headobj):
-        cls.viewport().wireframer().init_geom_data(headobj)
-        cls.viewport().wireframer().init_edge_indices(headobj)
-        cls.viewport().wireframer().create_batches()
+        """ Positions only, buffers are rebuilt on topology change """
+        cls.viewport().wireframer().update_positions(headobj)
+        cls.viewport().wireframer().update_position_batches()
 
     @classmethod
     def fb_redraw(cls, headnum, camnum):
@@ -312,60 +320,52 @@ class FBLoader:
             raise Exception('Unknown error in UV selector')
 
     @classmethod
-    def get_builder_mesh(cls, builder, mesh_name='keentools_mesh',
-                         masks=(), uv_set='uv0', keyframe=None):
-        for i, m in enumerate(masks):
-            builder.set_mask(i, m)
-
-        cls.select_uv_set(builder, uv_set)
+    def get_mesh_arrays(cls, me, geom):
+        """ Points, face loops and UVs of pykeentools mesh as numpy arrays.
+        geom is the bulk vertex array of the same model """
+        points = np.asarray(geom, dtype=np.float32).reshape((-1, 3))
 
-        if keyframe is not None:
-            geo = builder.applied_args_model_at(keyframe)
-        else:
-            geo = builder.applied_args_model()
-        me = geo.mesh(0)
+        f_count = me.faces_count()
+        loop_totals = np.fromiter((me.face_size(i) for i in range(f_count)),
+                                  dtype=np.int32, count=f_count)
+        loop_starts = np.zeros(f_count, dtype=np.int32)
+        np.cumsum(loop_totals[:-1], out=loop_starts[1:])
 
-        v_count = me.points_count()
-        vertices = []
-        for i in range(0, v_count):
-            vertices.append(me.point(i))
+        loops_count = int(loop_totals.sum())
+        indices = np.fromiter(
+            (me.face_point(i, j)
+             for i in range(f_count) for j in range(loop_totals[i])),
+            dtype=np.int32, count=loops_count)
 
-        rot = np.array([[1., 0., 0.], [0., 0., 1.], [0., -1., 0]])
-        vertices2 = vertices @ rot
-        # vertices2 = vertices
+        # UVs are stored per loop
+        uvs = np.zeros((loops_count, 2), dtype=np.float32)
+        uvs_count = min(me.uvs_count(), loops_count)
+        if uvs_count > 0:
+            uvs[:uvs_count] = [me.uv(i) for i in range(uvs_count)]
 
-        f_count = me.faces_count()
-        faces = []
-
-        # Normals are not in use yet
-        normals = []
-        n = 0
-        for i in range(0, f_count):
-            row = []
-            for j in range(0, me.face_size(i)):
-                row.append(me.face_point(i, j))
-                normal = me.normal(i, j) @ rot
-                normals.append(tuple(normal))
-                n += 1
-            faces.append(tuple(row))
+        return points, indices, loop_starts, loop_totals, uvs
 
+    @classmethod
+    def create_mesh_from_arrays(cls, mesh_name, points, indices,
+                                loop_starts, loop_totals, uvs):
+        """ Bulk mesh creation. Points should be in Blender axes """
         mesh = bpy.data.meshes.new(mesh_name)
-        mesh.from_pydata(vertices2, [], faces)
+        mesh.vertices.add(len(points))
+        mesh.loops.add(len(indices))
+        mesh.polygons.add(len(loop_totals))
 
-        # Init Custom Normals (work on Shading Flat!)
-        # mesh.calc_normals_split()
-        # mesh.normals_split_custom_set(normals)
+        mesh.vertices.foreach_set('co', points.ravel())
+        mesh.polygons.foreach_set('loop_start', loop_starts)
+        mesh.polygons.foreach_set('loop_total', loop_totals)
+        mesh.polygons.foreach_set('vertices', indices)
+        mesh.update(calc_edges=True)
 
         # Simple Shade Smooth analog
-        values = [True] * len(mesh.polygons)
-        mesh.polygons.foreach_set('use_smooth', values)
+        mesh.polygons.foreach_set(
+            'use_smooth', np.ones(len(loop_totals), dtype=np.bool_))
 
         uvtex = mesh.uv_layers.new()
-        uvmap = uvtex.data
-        # Fill uvs in uvmap
-        uvs_count = me.uvs_count()
-        for i in range(uvs_count):
-            uvmap[i].uv = me.uv(i)
+        uvtex.data.foreach_set('uv', uvs.ravel())
 
         mesh.update()
 
@@ -375,12 +375,72 @@ class FBLoader:
 
         return mesh
 
+    @classmethod
+    def _get_builder_vertices(cls, builder, keyframe):
+        if keyframe is not None:
+            return builder.applied_args_model_vertices_at(keyframe)
+        return builder.applied_args_vertices()
+
+    @classmethod
+    def _get_cached_topology_points(cls, builder, topology, keyframe):
+        points = np.asarray(cls._get_builder_vertices(builder, keyframe),
+                            dtype=np.float32)
+        if len(points) != topology.points_count:
+            return None
+        return points
+
+    @classmethod
+    def get_builder_mesh(cls, builder, mesh_name='keentools_mesh',
+                         masks=(), uv_set='uv0', keyframe=None,
+                         model_index=None):
+        """ model_index=None means default model of the builder """
+        logger = logging.getLogger(__name__)
+        for i, m in enumerate(masks):
+            builder.set_mask(i, m)
+
+        cls.select_uv_set(builder, uv_set)
+
+        rot = np.array([[1., 0., 0.], [0., 0., 1.], [0., -1., 0]],
+                       dtype=np.float32)
+
+        key = FBTopologyCache.make_key(model_index, masks, uv_set)
+        topology = FBTopologyCache.get(key)
+        if topology is not None:
+            points = cls._get_cached_topology_points(builder, topology,
+                                                     keyframe)
+            if points is not None:
+                logger.debug('TOPOLOGY CACHE HIT: {}'.format(key))
+                return cls.create_mesh_from_arrays(
+                    mesh_name, points @ rot, topology.indices,
+                    topology.loop_starts, topology.loop_totals, topology.uvs)
+            logger.warning('TOPOLOGY CACHE MISMATCH: {}'.format(key))
+
+        if keyframe is not None:
+            geo = builder.applied_args_model_at(keyframe)
+        else:
+            geo = builder.applied_args_model()
+        me = geo.mesh(0)
+
+        points, indices, loop_starts, loop_totals, uvs = \
+            cls.get_mesh_arrays(me, cls._get_builder_vertices(builder,
+                                                              keyframe))
+        topology = FBMeshTopology(len(points), indices, loop_starts,
+                                  loop_totals, uvs)
+
+        mesh = cls.create_mesh_from_arrays(
+            mesh_name, points @ rot, topology.indices, topology.loop_starts,
+            topology.loop_totals, topology.uvs)
+        FBTopologyCache.put(key, topology)
+        return mesh
+
     @classmethod
     def universal_mesh_loader(cls, mesh_name='keentools_mesh',
                               masks=(), uv_set='uv0'):
         builder = cls.new_builder()
+        # New builder uses the first model, the same key as for
+        # heads with this model selected
         mesh = cls.get_builder_mesh(builder, mesh_name, masks, uv_set,
-                                    keyframe=None)
+                                    keyframe=None, model_index=0)
         return mesh
 
     @classmethod
@@ -656,7 +716,7 @@ class FBLoader:
         w = 0
         h = 0
         if img is not None:
-            w, h = img.size
+            w, h = image_size(img)
 
         if w == 0 and h == 0:
             w = bpy.context.scene.render.resolution_x
@@ -172,6 +172,7 @@ class FB_OT_TexSelector(Operator):
                            "to create texture.")
 
         layout.prop(settings, 'tex_auto_preview')
+        layout.prop(settings, 'tex_progressive')
 
 
     def invoke(self, context, event):
@@ -196,6 +197,8 @@ class FB_OT_TexSelector(Operator):
             elif res == {'FINISHED'}:
                 logger.debug('TEXTURE CREATED')
                 self.report({'INFO'}, "Texture has been created successfully")
+            elif res == {'RUNNING_MODAL'}:
+                logger.debug('PROGRESSIVE TEXTURE CREATION STARTED')
 
         return {'FINISHED'}
 
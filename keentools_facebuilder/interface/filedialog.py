@@ -27,10 +27,14 @@ from ..fbloader import FBLoader
 from ..config import Config, get_main_settings, get_operators
 
 from ..utils.exif_reader import (read_exif_to_camera,
-                                 update_image_groups,
+                                 read_exif_batch,
+                                 apply_exif_to_camera,
+                                 add_camera_to_image_groups,
+                                 update_camera_image_group,
                                  auto_setup_camera_from_exif)
 from ..utils.other import restore_ui_elements
 from ..utils.materials import find_tex_by_name
+from ..utils.residency import FBImageResidency
 
 
 class FB_OT_SingleFilebrowserExec(Operator):
@@ -77,7 +81,7 @@ def load_single_image_file(headnum, camnum, filepath):
         except RuntimeError:
             logger.error('FILE EXIF READ ERROR: {}'.format(filepath))
 
-        update_image_groups(head)
+        update_camera_image_group(head, camnum)
 
         camera = head.get_camera(camnum)
         camera.show_background_image()
@@ -251,26 +255,31 @@ class FB_OT_MultipleFilebrowser(Operator, ImportHelper):
         head = settings.get_head(self.headnum)
         last_camnum = head.get_last_camnum()
 
-        for f in self.files:
-            try:
-                filepath = os.path.join(self.directory, f.name)
-                logger.debug("IMAGE FILE: {}".format(filepath))
+        filepaths = [os.path.join(self.directory, f.name)
+                     for f in self.files]
+        # Files probing and EXIF parsing for all images at once
+        exif_batch = read_exif_batch(filepaths)
 
+        for filepath, exif_data in zip(filepaths, exif_batch):
+            logger.debug("IMAGE FILE: {}".format(filepath))
+            if exif_data is None:
+                logger.error("FILE NOT FOUND: {}".format(filepath))
+                continue
+            try:
                 camera = FBLoader.add_new_camera_with_image(self.headnum,
                                                             filepath)
-                read_exif_to_camera(
-                    self.headnum, head.get_last_camnum(), filepath)
+                apply_exif_to_camera(camera, exif_data)
                 camera.orientation = camera.exif.orientation
+                add_camera_to_image_groups(head, head.get_last_camnum())
 
             except RuntimeError as ex:
-                logger.error("FILE READ ERROR: {}".format(f.name))
+                logger.error("FILE READ ERROR: {}".format(filepath))
 
         for i, camera in enumerate(head.cameras):
             if i > last_camnum:
                 auto_setup_camera_from_exif(camera)
                 FBLoader.center_geo_camera_projection(self.headnum, i)
 
-        update_image_groups(head)
-
+        FBImageResidency.enforce_budget()
         FBLoader.save_only(self.headnum)
         return {'FINISHED'}
@@ -402,6 +402,20 @@ class FB_PT_ViewsPanel(Panel):
         op.headnum = headnum
         op.camnum = camnum
 
+        self._draw_residual_stats(box, headnum, camnum)
+
+    def _draw_residual_stats(self, layout, headnum, camnum):
+        settings = get_main_settings()
+        kid = settings.get_keyframe(headnum, camnum)
+        stats = FBLoader.viewport().residual_stats(kid)
+        if stats is None:
+            return
+        col = layout.column()
+        col.scale_y = Config.text_scale_y
+        col.label(text='Residuals ({} pins):'.format(stats['count']))
+        col.label(text='mean {:.1f}px  max {:.1f}px  RMS {:.1f}px'.format(
+            stats['mean'], stats['max'], stats['rms']))
+
     def _draw_camera_list(self, headnum, layout):
         settings = get_main_settings()
         head = settings.get_head(headnum)
@@ -597,6 +611,11 @@ class FB_PT_TexturePanel(Panel):
         box = layout.box()
         box.prop(head, 'tex_uv_shape')
 
+        box = layout.box()
+        box.prop(settings, 'tex_save_to_file')
+        if settings.tex_save_to_file:
+            box.row().prop(settings, 'tex_file_format', expand=True)
+
         row = layout.row()
         row.scale_y = 2.0
         op = row.operator(Config.fb_tex_selector_idname,
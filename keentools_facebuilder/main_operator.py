@@ -35,7 +35,8 @@ from .utils.exif_reader import (read_exif_from_camera,
                                 update_exif_sizes_message,
                                 get_sensor_size_35mm_equivalent,
                                 copy_exif_parameters_from_camera_to_head,
-                                update_image_groups)
+                                remove_camera_from_image_groups)
+from .utils.image_groups import FBImageGroups
 
 
 class FB_OT_SelectHead(Operator):
@@ -96,6 +97,7 @@ class FB_OT_DeleteHead(Operator):
         except Exception:
             pass
         settings.heads.remove(self.headnum)
+        FBImageGroups.clear()
         return {'FINISHED'}
 
 
@@ -359,7 +361,7 @@ class FB_OT_DeleteCamera(Operator):
             settings.current_camnum = -1
 
         FBLoader.fb_save(headnum, settings.current_camnum)
-        update_image_groups(head)
+        remove_camera_from_image_groups(head, camnum)
 
         logger = logging.getLogger(__name__)
         logger.debug("CAMERA H:{} C:{} REMOVED".format(headnum, camnum))
@@ -512,11 +514,34 @@ class FB_OT_BakeTexture(Operator):
 
     headnum: IntProperty(default=0)
 
+    _timer = None
+    _passes = []
+    _pass_count = 0
+    _preview_shown = False
+
     def draw(self, context):
         pass
 
+    def _show_texture(self, head):
+        mat = materials.show_texture_in_mat(
+            Config.tex_builder_filename,
+            Config.tex_builder_matname)
+        materials.assign_material_to_object(head.headobj, mat)
+        materials.toggle_mode(('MATERIAL',))
+
+    def _finish(self, context, head):
+        settings = get_main_settings()
+        if settings.tex_auto_preview:
+            self._show_texture(head)
+
+            if settings.pinmode:
+                settings.force_out_pinmode = True
+                if head.should_use_emotions():
+                    bpy.ops.view3d.view_camera()
+
     def execute(self, context):
         settings = get_main_settings()
+        materials.FBBakeProgress.reset()
         texture_baked = materials.bake_tex(
             self.headnum, Config.tex_builder_filename)
         head = settings.get_head(self.headnum)
@@ -524,18 +549,72 @@ class FB_OT_BakeTexture(Operator):
         if not texture_baked:
             return {'CANCELLED'}
 
-        if settings.tex_auto_preview:
-            mat = materials.show_texture_in_mat(
-                Config.tex_builder_filename,
-                Config.tex_builder_matname)
-            materials.assign_material_to_object(head.headobj, mat)
-            materials.toggle_mode(('MATERIAL',))
+        self._finish(context, head)
+        return {'FINISHED'}
 
-            if settings.pinmode:
-                settings.force_out_pinmode = True
-                if head.should_use_emotions():
-                    bpy.ops.view3d.view_camera()
+    def invoke(self, context, event):
+        settings = get_main_settings()
+        if not settings.tex_progressive:
+            return self.execute(context)
+
+        materials.FBBakeProgress.reset()
+        self._passes = list(Config.tex_progressive_passes)
+        self._pass_count = len(self._passes)
+        self._preview_shown = False
+        # Each pass is started by timer, so interface is redrawn between
+        self._timer = context.window_manager.event_timer_add(
+            0.01, window=context.window)
+        context.window_manager.modal_handler_add(self)
+        return {'RUNNING_MODAL'}
+
+    def _stop(self, context):
+        context.window_manager.event_timer_remove(self._timer)
+        self._timer = None
+
+    def _cancel(self, context):
+        """ Unfinished preview texture is removed """
+        self._stop(context)
+        if self._preview_shown:
+            materials.remove_tex_by_name(Config.tex_builder_filename)
+            materials.remove_mat_by_name(Config.tex_builder_matname)
+            op = getattr(get_operators(), Config.fb_show_solid_callname)
+            op('EXEC_DEFAULT')
+        return {'CANCELLED'}
+
+    def modal(self, context, event):
+        logger = logging.getLogger(__name__)
+        if event.type == 'ESC':
+            # Running pass checks the flag in its progress callback
+            materials.FBBakeProgress.request_cancel()
+            logger.debug('PROGRESSIVE TEXTURE CREATION STOPPED')
+            return self._cancel(context)
+
+        if event.type != 'TIMER':
+            return {'PASS_THROUGH'}
+
+        settings = get_main_settings()
+        head = settings.get_head(self.headnum)
+        downscale = self._passes.pop(0)
+        logger.debug('PROGRESSIVE TEXTURE PASS {}/{} DOWNSCALE: {}'.format(
+            self._pass_count - len(self._passes), self._pass_count,
+            downscale))
+        # Preview passes are not saved, the last one uses settings
+        texture_baked = materials.bake_tex(
+            self.headnum, Config.tex_builder_filename, downscale,
+            filepath=None)
+
+        if not texture_baked:
+            return self._cancel(context)
+
+        if len(self._passes) > 0:
+            # Preview is shown regardless of auto preview setting
+            self._show_texture(head)
+            self._preview_shown = True
+            return {'RUNNING_MODAL'}
 
+        self._stop(context)
+        self._finish(context, head)
+        self.report({'INFO'}, "Texture has been created successfully")
         return {'FINISHED'}
 
 
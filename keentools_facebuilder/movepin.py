@@ -43,6 +43,40 @@ def profile_this(fn):
     return wrapped
 
 
+class FBDragState:
+    """ Last committed builder state kept in memory while pin is dragged.
+    Scene properties are written only on release """
+    _serial_str = ''
+    _model_mat = None
+    _moved = False
+
+    @classmethod
+    def start(cls, serial_str, model_mat):
+        cls._serial_str = serial_str
+        cls._model_mat = model_mat
+        cls._moved = False
+
+    @classmethod
+    def reset(cls):
+        cls.start('', None)
+
+    @classmethod
+    def set_moved(cls):
+        cls._moved = True
+
+    @classmethod
+    def has_previous_state(cls):
+        return cls._moved and cls._serial_str != ''
+
+    @classmethod
+    def serial_str(cls):
+        return cls._serial_str
+
+    @classmethod
+    def model_mat(cls):
+        return cls._model_mat
+
+
 class FB_OT_MovePin(bpy.types.Operator):
     """ On Screen Face Builder MovePin Operator """
     bl_idname = Config.fb_movepin_idname
@@ -84,6 +118,8 @@ class FB_OT_MovePin(bpy.types.Operator):
             vp.pins().add_pin((x, y))
             vp.pins().set_current_pin_num_to_last()
             FBLoader.update_pins_count(headnum, camnum)
+            # Undo step for new pin is already pushed
+            FBDragState.reset()
 
             manipulate.push_neutral_head_in_undo_history(
                 settings.get_head(headnum), kid, 'New Pin.')
@@ -108,14 +144,12 @@ class FB_OT_MovePin(bpy.types.Operator):
         if cam is None:
             return {'CANCELLED'}
 
-        # Init old state values
-        head.tmp_serial_str = ''
-        cam.tmp_model_mat = ''
-
         vp = FBLoader.viewport()
         vp.update_view_relative_pixel_size(context)
 
         FBLoader.load_model(headnum)
+        # Builder is loaded from scene, so its state is already serialized
+        FBDragState.start(head.get_serial_str(), cam.get_model_mat())
         FBLoader.place_camera(headnum, camnum)
         FBLoader.load_pins(headnum, camnum)
 
@@ -126,9 +160,9 @@ class FB_OT_MovePin(bpy.types.Operator):
         x, y = coords.get_image_space_coord(mouse_x, mouse_y, context)
         vp.pins().set_current_pin((x, y))
 
-        nearest, dist2 = coords.nearest_point(x, y, vp.pins().arr())
+        nearest, _ = vp.pins().nearest(x, y, vp.tolerance_dist2())
 
-        if nearest >= 0 and dist2 < vp.tolerance_dist2():
+        if nearest >= 0:
             vp.pins().set_current_pin_num(nearest)
         else:
             return self._new_pin(context, mouse_x, mouse_y)
@@ -143,17 +177,19 @@ class FB_OT_MovePin(bpy.types.Operator):
         kid = cam.get_keyframe()
 
         fb = FBLoader.get_builder()
-        # Save state to vars
-        serial_str = head.serial_str
-        model_mat = cam.model_mat
 
-        # Prepare previous state to push in history
-        if head.tmp_serial_str != '':
-            cam.model_mat = cam.tmp_model_mat
-            head.set_serial_str(head.get_tmp_serial_str())
+        if FBDragState.has_previous_state():
+            # Current state is serialized once per drag
+            serial_str = fb.serialize()
+            model_mat = fb.model_mat(kid)
+
+            # Prepare previous state to push in history
+            cam.set_model_mat(FBDragState.model_mat())
+            head.set_serial_str(FBDragState.serial_str())
 
             if not fb.deserialize(head.get_serial_str()):
-                logger.warning('DESERIALIZE ERROR: ', head.get_serial_str())
+                logger.warning('DESERIALIZE ERROR: {}'.format(
+                    head.get_serial_str()))
 
             FBLoader.update_all_camera_positions(headnum)
             # ---------
@@ -162,15 +198,16 @@ class FB_OT_MovePin(bpy.types.Operator):
             # ---------
             # Restore last position
             head.set_serial_str(serial_str)
-            cam.model_mat = model_mat
+            cam.set_model_mat(model_mat)
 
-            if not fb.deserialize(head.get_serial_str()):
-                logger.warning("DESERIALIZE ERROR: {}", head.get_serial_str())
+            if not fb.deserialize(serial_str):
+                logger.warning('DESERIALIZE ERROR: {}'.format(serial_str))
         else:
             # There was only one click
             # Save current state
             head.set_serial_str(fb.serialize())
             cam.set_model_mat(fb.model_mat(kid))
+        FBDragState.reset()
 
     def on_left_mouse_release(self, context, mouse_x, mouse_y):
         settings = get_main_settings()
@@ -184,7 +221,7 @@ class FB_OT_MovePin(bpy.types.Operator):
         pins = vp.pins()
         if pins.current_pin() is not None:
             # Move current 2D-pin
-            pins.arr()[pins.current_pin_num()] = (x, y)
+            pins.set_pin(pins.current_pin_num(), (x, y))
 
         pins.reset_current_pin()
         FBLoader.update_head_camera_focals(head)
@@ -211,7 +248,7 @@ class FB_OT_MovePin(bpy.types.Operator):
         pins = FBLoader.viewport().pins()
         pins.set_current_pin((x, y))
         pin_idx = pins.current_pin_num()
-        pins.arr()[pin_idx] = (x, y)
+        pins.set_pin(pin_idx, (x, y))
         fb.move_pin(kid, pin_idx, coords.image_space_to_frame(x, y))
 
     def on_mouse_move(self, context, mouse_x, mouse_y):
@@ -233,23 +270,15 @@ class FB_OT_MovePin(bpy.types.Operator):
             return {'FINISHED'}
 
         fb = FBLoader.get_builder()
-        # --------------
-        # Pin lag solve
-        # --------------
-        head = settings.get_head(headnum)
-        # Store in tmp previous state
-        head.tmp_serial_str = head.serial_str
-        cam.tmp_model_mat = cam.model_mat
-        # Save current state
-        head.set_serial_str(fb.serialize())
-        cam.set_model_mat(fb.model_mat(kid))
-        # --------------
+        # Scene properties are updated on release only
+        FBDragState.set_moved()
 
         FBLoader.place_cameraobj(kid, camobj, headobj)
         coords.update_head_mesh(settings, fb, head)
 
-        FBLoader.viewport().wireframer().init_geom_data(headobj)
-        FBLoader.viewport().wireframer().create_batches()
+        # Topology is the same while dragging, so only positions are updated
+        FBLoader.viewport().wireframer().update_positions(headobj)
+        FBLoader.viewport().wireframer().update_position_batches()
         FBLoader.viewport().create_batch_2d(context)
         # Try to redraw
         if not bpy.app.background:
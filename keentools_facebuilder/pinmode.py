@@ -21,10 +21,11 @@ from uuid import uuid4
 
 import bpy
 
-from .utils import manipulate, coords, cameras
+from .utils import manipulate, coords, cameras, proxy
 from .config import Config, get_main_settings, get_operators, ErrorType
 from .fbloader import FBLoader
 from .utils.other import FBStopShaderTimer, force_ui_redraw, hide_ui_elements
+from .utils.residency import FBImageResidency
 
 
 class FB_OT_PinMode(bpy.types.Operator):
@@ -68,15 +69,6 @@ class FB_OT_PinMode(bpy.types.Operator):
             warn = getattr(get_operators(), Config.fb_warning_callname)
             warn('INVOKE_DEFAULT', msg=ErrorType.SceneDamaged)
 
-    def _coloring_special_parts(self, headobj, opacity):
-        settings = get_main_settings()
-        if settings.show_specials:
-            special_indices = FBLoader.viewport().get_special_indices()
-            special_color = (*settings.wireframe_special_color,
-                             opacity * settings.wireframe_opacity)
-            FBLoader.viewport().wireframer().init_special_areas(
-                headobj.data, special_indices, special_color)
-
     def _init_wireframer_colors(self, opacity):
         settings = get_main_settings()
         head = settings.get_head(settings.current_headnum)
@@ -85,9 +77,10 @@ class FB_OT_PinMode(bpy.types.Operator):
         FBLoader.viewport().wireframer().init_geom_data(headobj)
         FBLoader.viewport().wireframer().init_edge_indices(headobj)
 
-        FBLoader.viewport().wireframer().init_color_data(
-            (*settings.wireframe_color, opacity * settings.wireframe_opacity))
-        self._coloring_special_parts(headobj, opacity)
+        FBLoader.viewport().init_wireframe_colors(
+            (*settings.wireframe_color, opacity * settings.wireframe_opacity),
+            (*settings.wireframe_special_color,
+             opacity * settings.wireframe_opacity))
 
         FBLoader.viewport().wireframer().create_batches()
 
@@ -100,7 +93,7 @@ class FB_OT_PinMode(bpy.types.Operator):
 
         fb = FBLoader.get_builder()
         fb.remove_pin(kid, nearest)
-        del FBLoader.viewport().pins().arr()[nearest]
+        FBLoader.viewport().pins().remove_pin(nearest)
         logging.debug("PIN REMOVED {}".format(nearest))
 
         if not FBLoader.solve(headnum, camnum):
@@ -147,8 +140,8 @@ class FB_OT_PinMode(bpy.types.Operator):
 
         x, y = coords.get_image_space_coord(mouse_x, mouse_y, context)
 
-        nearest, dist2 = coords.nearest_point(x, y, vp.pins().arr())
-        if nearest >= 0 and dist2 < FBLoader.viewport().tolerance_dist2():
+        nearest, _ = vp.pins().nearest(x, y, vp.tolerance_dist2())
+        if nearest >= 0:
             return self._delete_found_pin(nearest, context)
 
         FBLoader.viewport().create_batch_2d(context)
@@ -216,11 +209,26 @@ class FB_OT_PinMode(bpy.types.Operator):
         else:
             FBLoader.update_cameras_from_old_version(self.headnum)
 
+        # Proxy background is used only while camera is in pin mode
+        if settings.current_headnum >= 0 and settings.current_camnum >= 0:
+            prev_camera = settings.get_camera(settings.current_headnum,
+                                              settings.current_camnum)
+            if prev_camera is not None:
+                proxy.restore_background(prev_camera)
+
         settings.current_headnum = self.headnum
         settings.current_camnum = self.camnum
         settings.pinmode = True
 
         camera = head.get_camera(settings.current_camnum)
+        background = proxy.pinmode_background(camera)
+        if background is not None:
+            camera.show_background_image(background)
+        # Full resolution image is not needed while proxy is shown
+        if background == camera.cam_image:
+            FBImageResidency.use(camera.cam_image, pin=True)
+        else:
+            FBImageResidency.unpin()
         camera.update_scene_frame_size()
         camera.update_background_image_scale()
         kid = camera.get_keyframe()
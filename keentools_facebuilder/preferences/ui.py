@@ -22,6 +22,8 @@ import bpy
 import keentools_facebuilder.preferences.operators as preferences_operators
 import keentools_facebuilder.blender_independent_packages.pykeentools_loader as pkt
 from ..config import (Config, is_blender_supported)
+from ..utils.images import FBImageBufferPool
+from ..utils.residency import FBImageResidency
 from .formatting import split_by_br_or_newlines
 from ..preferences.progress import InstallationProgress
 from ..messages import (ERROR_MESSAGES, USER_MESSAGES, draw_system_info,
@@ -103,6 +105,28 @@ class FBAddonPreferences(bpy.types.AddonPreferences):
         default=False
     )
 
+    image_memory_budget: bpy.props.IntProperty(
+        name="Camera images memory (MB)",
+        description="Least recently used camera images are unloaded "
+                    "from memory when their total size is over this limit",
+        default=Config.image_memory_budget // (1024 * 1024),
+        min=256, soft_max=32768,
+        update=lambda self, context: FBImageResidency.enforce_budget()
+    )
+
+    use_proxy_backgrounds: bpy.props.BoolProperty(
+        name="Low resolution backgrounds in Pin mode",
+        description="Show downscaled copies of large images in Pin mode "
+                    "for faster switching between views. "
+                    "Texture is baked from full resolution images",
+        default=False
+    )
+
+    proxy_long_side: bpy.props.IntProperty(
+        name="Background long side (px)",
+        default=Config.proxy_long_side, min=512, soft_max=8192
+    )
+
     def _license_was_accepted(self):
         return pkt.is_installed() or self.license_accepted
 
@@ -324,6 +348,28 @@ class FBAddonPreferences(bpy.types.AddonPreferences):
         col.scale_y = Config.text_scale_y
         draw_long_labels(col, info, 120)
 
+    def _draw_image_memory(self, layout):
+        box = layout.box()
+        box.prop(self, 'image_memory_budget')
+        row = box.split(factor=0.6)
+        row.prop(self, 'use_proxy_backgrounds')
+        col = row.column()
+        col.active = self.use_proxy_backgrounds
+        col.prop(self, 'proxy_long_side', text='Long side')
+        try:
+            stats = FBImageResidency.stats()
+        except AttributeError:  # No scene settings
+            return
+        mb = 1024 * 1024
+        col = box.column()
+        col.scale_y = Config.text_scale_y
+        col.label(text='Loaded camera images: {}, {:.0f} MB'.format(
+            stats['loaded'], stats['nbytes'] / mb))
+        col.label(text='Unloaded to fit the limit: {}'.format(
+            stats['released']))
+        col.label(text='Texture baking buffers: {:.0f} MB'.format(
+            FBImageBufferPool.nbytes() / mb))
+
     def draw(self, context):
         layout = self.layout
 
@@ -353,6 +399,7 @@ class FBAddonPreferences(bpy.types.AddonPreferences):
             try:
                 self._draw_version(box)
                 self._draw_license_info(layout)
+                self._draw_image_memory(layout)
                 return
             except Exception:
                 cached_status[1] = 'NO_VERSION'
@@ -36,7 +36,9 @@ from bpy.props import (
     BoolVectorProperty
 )
 from bpy.types import PropertyGroup
-from .utils import coords
+from .utils import coords, head_state
+from .utils.image_groups import FBImageGroups
+from .utils.images import image_size
 from . config import Config, get_main_settings, get_operators
 from .utils.manipulate import what_is_state
 
@@ -175,7 +177,8 @@ def update_mesh_geometry(self, context):
     mesh = FBLoader.get_builder_mesh(fb, 'FBHead_tmp_mesh',
                                      head.get_masks(),
                                      uv_set=head.tex_uv_shape,
-                                     keyframe=keyframe)
+                                     keyframe=keyframe,
+                                     model_index=model_index)
     try:
         # Copy old material
         if old_mesh.materials:
@@ -247,9 +250,6 @@ class FBCameraItem(PropertyGroup):
     model_mat: StringProperty(
         name="Model Matrix", default=""
     )
-    tmp_model_mat: StringProperty(
-        name="Temporary Model Matrix", default=""
-    )
     pins_count: IntProperty(
         name="Pins in Camera", default=0)
 
@@ -297,10 +297,13 @@ class FBCameraItem(PropertyGroup):
             return c.background_images[0]
 
     def get_background_size(self):
+        # Background can be a low resolution proxy of camera image
+        if self.cam_image:
+            return image_size(self.cam_image)
         img = self.get_camera_background()
         if img is not None:
             if img.image:
-                return img.image.size
+                return image_size(img.image)
         return -1, -1
 
     def reset_background_image_rotation(self):
@@ -322,14 +325,15 @@ class FBCameraItem(PropertyGroup):
             self.orientation += -4
         background_image.rotation = self.orientation * math.pi / 2
 
-    def show_background_image(self):
+    def show_background_image(self, image=None):
+        """ Camera image or its proxy as camera background """
         data = self.camobj.data
         data.show_background_images = True
         if len(data.background_images) == 0:
             b = data.background_images.new()
         else:
             b = data.background_images[0]
-        b.image = self.cam_image
+        b.image = self.cam_image if image is None else image
         b.rotation = self.orientation * math.pi / 2
 
     def calculate_background_scale(self):
@@ -379,16 +383,15 @@ class FBCameraItem(PropertyGroup):
         return np.frombuffer(b, dtype=np.float32).reshape((4, 4))
 
     def set_model_mat(self, arr):
-        self.model_mat = self.convert_matrix_to_str(arr)
+        self[Config.fb_model_mat_blob_name] = head_state.pack_matrix(arr)
+        # Legacy hex storage is not used after migration
+        self.model_mat = ''
 
     def get_model_mat(self):
-        return self.convert_str_to_matrix(self.model_mat)
-
-    def set_tmp_model_mat(self, arr):
-        self.tmp_model_mat = self.convert_matrix_to_str(arr)
-
-    def get_tmp_model_mat(self):
-        return self.convert_str_to_matrix(self.tmp_model_mat)
+        blob = self.get(Config.fb_model_mat_blob_name)
+        if blob is None:
+            return self.convert_str_to_matrix(self.model_mat)
+        return head_state.unpack_matrix(blob)
 
     # Simple getters/setters
     def get_image_width(self):
@@ -408,7 +411,7 @@ class FBCameraItem(PropertyGroup):
         w = -1
         h = -1
         if self.cam_image:
-            w, h = self.cam_image.size
+            w, h = image_size(self.cam_image)
             self.image_width = w
             self.image_height = h
         return w, h
@@ -424,7 +427,8 @@ class FBCameraItem(PropertyGroup):
         self.set_image_height(h)
 
     def is_model_mat_empty(self):
-        return self.model_mat == ''
+        return self.get(Config.fb_model_mat_blob_name) is None and \
+            self.model_mat == ''
 
     def is_deleted(self):
         """ Checks that the list item references a non-existent object """
@@ -561,7 +565,6 @@ class FBHeadItem(PropertyGroup):
                               update=update_mesh_geometry)
 
     serial_str: StringProperty(name="Serialization string", default="")
-    tmp_serial_str: StringProperty(name="Temporary Serialization", default="")
     need_update: BoolProperty(name="Mesh need update", default=False)
 
     tex_uv_shape: EnumProperty(name="UV", items=uv_items_callback,
@@ -618,14 +621,17 @@ class FBHeadItem(PropertyGroup):
         return self.get_camera(self.get_last_camnum())
 
     def set_serial_str(self, value):
-        self.serial_str = value
-        self.headobj[Config.fb_serial_prop_name[0]] = value
+        blob = head_state.pack_serial(value)
+        self[Config.fb_serial_blob_name] = blob
+        # Legacy string storage is not used after migration
+        self.serial_str = ''
+        self.headobj[Config.fb_serial_prop_name[0]] = blob
 
     def get_serial_str(self):
-        return self.serial_str
-
-    def get_tmp_serial_str(self):
-        return self.tmp_serial_str
+        blob = self.get(Config.fb_serial_blob_name)
+        if blob is None:
+            return self.serial_str
+        return head_state.unpack_serial(blob)
 
     def is_deleted(self):
         """ Checks that the list item references a non-existent object """
@@ -822,6 +828,20 @@ class FBSceneSettings(PropertyGroup):
     tex_auto_preview: BoolProperty(
         description="Automatically apply the created texture",
         name="Automatically apply the created texture", default=True)
+    tex_progressive: BoolProperty(
+        description="Show a quick low resolution texture first, "
+                    "then replace it with full resolution one. "
+                    "Press Esc to stop after current pass",
+        name="Progressive texture creation", default=False)
+    tex_save_to_file: BoolProperty(
+        description="Save created texture to a file next to .blend file "
+                    "and link it instead of packing into .blend",
+        name="Save to file next to .blend", default=False)
+    tex_file_format: EnumProperty(
+        name="Texture file format", items=[
+            ('PNG', 'PNG', '8-bit image', 0),
+            ('OPEN_EXR', 'EXR', 'Floating point image', 1),
+        ], description="File format of saved texture", default='PNG')
 
     # Workaround to get blue button for selected camera
     blue_camera_button: BoolProperty(
@@ -943,6 +963,8 @@ class FBSceneSettings(PropertyGroup):
                     cams_deleted += 1  # At least one camera is deleted
         for i in reversed(err):
             self.heads.remove(i)
+        if heads_deleted > 0:
+            FBImageGroups.clear()
         return heads_deleted, cams_deleted
 
     def head_by_obj(self, obj):
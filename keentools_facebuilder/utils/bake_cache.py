@@ -0,0 +1,166 @@
+# ##### BEGIN GPL LICENSE BLOCK #####
+# KeenTools for blender is a blender addon for using KeenTools in Blender.
+# Copyright (C) 2019  KeenTools
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+# ##### END GPL LICENSE BLOCK #####
+
+
+import hashlib
+import logging
+import os
+import tempfile
+
+import bpy
+import numpy as np
+
+from .. config import Config
+import keentools_facebuilder.blender_independent_packages.pykeentools_loader as pkt
+
+
+_CACHE_VERSION = 2
+_FILE_EXT = '.npy'
+# Settings which do not change bake result
+_IGNORED_TEX_SETTINGS = {'tex_auto_preview', 'tex_progressive',
+                         'tex_save_to_file', 'tex_file_format'}
+
+
+def cache_dir():
+    return os.path.join(tempfile.gettempdir(), Config.bake_cache_dir_name)
+
+
+def _image_identity(image):
+    """ File path, size and modification time or None if not a file """
+    if image is None or image.packed_file is not None:
+        return None
+    path = bpy.path.abspath(image.filepath, library=image.library)
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    library = image.library.filepath if image.library is not None else ''
+    return os.path.normpath(path), library, stat.st_size, stat.st_mtime_ns
+
+
+def _tex_settings(settings):
+    return [(prop.identifier, getattr(settings, prop.identifier))
+            for prop in settings.bl_rna.properties
+            if prop.identifier.startswith('tex_') and
+            prop.identifier not in _IGNORED_TEX_SETTINGS]
+
+
+def make_key(settings, head, camnums, downscale=1):
+    """ Digest of everything that affects bake result.
+    None if some camera image has no file identity """
+    digest = hashlib.sha256()
+
+    def _add(value):
+        digest.update(repr(value).encode('utf-8'))
+        digest.update(b'\0')
+
+    _add(_CACHE_VERSION)
+    _add(pkt.module().__version__)
+    _add(head.get_serial_str())
+    _add((head.model_type, head.model_scale, head.tex_uv_shape,
+          tuple(head.masks), head.should_use_emotions()))
+    _add(_tex_settings(settings))
+    _add(downscale)
+    for camnum in camnums:
+        cam = head.cameras[camnum]
+        identity = _image_identity(cam.cam_image)
+        if identity is None:
+            return None
+        _add((camnum, cam.get_keyframe(), cam.orientation, identity))
+        digest.update(np.ascontiguousarray(
+            cam.get_model_mat(), dtype=np.float32).tobytes())
+        digest.update(np.ascontiguousarray(
+            cam.get_projection_matrix(), dtype=np.float32).tobytes())
+    return digest.hexdigest()
+
+
+def _entry_path(key):
+    return os.path.join(cache_dir(), key + _FILE_EXT)
+
+
+def load(key):
+    logger = logging.getLogger(__name__)
+    path = _entry_path(key)
+    if not os.path.exists(path):
+        return None
+    try:
+        img = np.load(path).astype(np.float32, copy=False)
+    except (OSError, ValueError) as err:
+        logger.error('BAKE CACHE READ ERROR: {}'.format(str(err)))
+        return None
+    # Modification time is used as last access time for eviction
+    os.utime(path, None)
+    return img
+
+
+def store(key, img):
+    logger = logging.getLogger(__name__)
+    path = _entry_path(key)
+    tmp_path = path + '.tmp'
+    try:
+        os.makedirs(cache_dir(), exist_ok=True)
+        # Full precision, so cached EXR output is the same as baked one
+        with open(tmp_path, 'wb') as f:
+            np.save(f, np.asarray(img, dtype=np.float32))
+        os.replace(tmp_path, path)
+    except OSError as err:
+        logger.error('BAKE CACHE WRITE ERROR: {}'.format(str(err)))
+        return False
+    evict(Config.bake_cache_max_size)
+    return True
+
+
+def _entries():
+    directory = cache_dir()
+    if not os.path.isdir(directory):
+        return []
+    res = []
+    for name in os.listdir(directory):
+        if not name.endswith(_FILE_EXT):
+            continue
+        try:
+            stat = os.stat(os.path.join(directory, name))
+        except OSError:
+            continue
+        res.append((stat.st_mtime, stat.st_size, name))
+    return res
+
+
+def evict(max_size):
+    """ Remove least recently used entries until cache fits max_size """
+    logger = logging.getLogger(__name__)
+    entries = sorted(_entries())
+    total = sum(size for _, size, _ in entries)
+    for _, size, name in entries:
+        if total <= max_size:
+            break
+        try:
+            os.remove(os.path.join(cache_dir(), name))
+            total -= size
+            logger.debug('BAKE CACHE EVICT: {}'.format(name))
+        except OSError:
+            pass
+    return total
+
+
+def clear():
+    return evict(0)
+
+
+def size():
+    return sum(size for _, size, _ in _entries())
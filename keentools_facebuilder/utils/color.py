@@ -0,0 +1,84 @@
+# ##### BEGIN GPL LICENSE BLOCK #####
+# KeenTools for blender is a blender addon for using KeenTools in Blender.
+# Copyright (C) 2019  KeenTools
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+# ##### END GPL LICENSE BLOCK #####
+
+
+""" In place sRGB to linear conversion of float32 RGBA images """
+import numpy as np
+
+from .. config import Config
+
+
+_LUT8 = None
+_LUT_FLOAT = None
+
+
+def srgb_to_linear_formula(x):
+    """ Reference piecewise formula, not in place """
+    x = np.asarray(x, dtype=np.float64)
+    return np.where(x < 0.04045, 25 * x / 323,
+                    ((200 * np.maximum(x, 0.04045) + 11) / 211) ** (12 / 5))
+
+
+def _get_lut8():
+    global _LUT8
+    if _LUT8 is None:
+        _LUT8 = srgb_to_linear_formula(
+            np.arange(256) / 255).astype(np.float32)
+    return _LUT8
+
+
+def _get_lut_float():
+    global _LUT_FLOAT
+    if _LUT_FLOAT is None:
+        size = Config.srgb_lut_size
+        _LUT_FLOAT = srgb_to_linear_formula(
+            np.arange(size) / (size - 1)).astype(np.float32)
+    return _LUT_FLOAT
+
+
+def _convert_chunk_8bit(chunk):
+    """ Values are exact multiples of 1/255 for 8-bit source images """
+    idx = np.rint(chunk * 255).astype(np.int32)
+    np.clip(idx, 0, 255, out=idx)
+    chunk[...] = _get_lut8()[idx]
+
+
+def _convert_chunk_float(chunk):
+    """ Linear interpolation in LUT, formula out of [0, 1] range """
+    lut = _get_lut_float()
+    pos = np.clip(chunk, 0.0, 1.0) * np.float32(len(lut) - 1)
+    idx = np.minimum(pos.astype(np.int32), len(lut) - 2)
+    pos -= idx
+    out_of_range = (chunk < 0.0) | (chunk > 1.0)
+    outliers = chunk[out_of_range] if np.any(out_of_range) else None
+
+    low = lut[idx]
+    chunk[...] = low + pos * (lut[idx + 1] - low)
+    if outliers is not None:
+        chunk[out_of_range] = srgb_to_linear_formula(outliers)
+
+
+def srgb_to_linear(img, is_8bit=False, chunk_rows=None):
+    """ Converts RGB channels of (h, w, 4) float32 image in place.
+    Works with image views (rotated images too), returns img """
+    if chunk_rows is None:
+        chunk_rows = max(1, Config.srgb_chunk_pixels // max(1, img.shape[1]))
+    convert = _convert_chunk_8bit if is_8bit else _convert_chunk_float
+    for start in range(0, img.shape[0], chunk_rows):
+        convert(img[start:start + chunk_rows, :, :3])
+    return img
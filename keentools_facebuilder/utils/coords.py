@@ -22,14 +22,14 @@ from . fake_context import get_fake_context
 
 
 def nearest_point(x, y, points, dist=4000000):  # dist squared
-    dist2 = dist
-    nearest = -1
-    for i, p in enumerate(points):
-        d2 = (x - p[0]) ** 2 + (y - p[1]) ** 2
-        if d2 < dist2:
-            dist2 = d2
-            nearest = i
-    return nearest, dist2
+    points = np.asarray(points, dtype=np.float32).reshape((-1, 2))
+    if len(points) == 0:
+        return -1, dist
+    d2 = (points[:, 0] - x) ** 2 + (points[:, 1] - y) ** 2
+    nearest = int(np.argmin(d2))
+    if d2[nearest] < dist:
+        return nearest, float(d2[nearest])
+    return -1, dist
 
 
 def update_head_mesh_geom(obj, geom):
@@ -129,6 +129,18 @@ def pin_to_xyz(pin, headobj):
     return p
 
 
+def get_mesh_verts(mesh):
+    """ All mesh vertices as (N, 3) float32 array """
+    verts = np.empty((len(mesh.vertices), 3), dtype=np.float32)
+    mesh.vertices.foreach_get('co', verts.ravel())
+    return verts
+
+
+def barycentric_to_xyz(verts, geo_point_idxs, barycentric):
+    """ Batched pin_to_xyz: (N, 3) indices and (N, 3) coords to XYZ """
+    return np.einsum('ij,ijk->ik', barycentric, verts[geo_point_idxs])
+
+
 def calc_model_mat(model_mat, head_mat):
     """ Convert model matrix to camera matrix """
     rot_mat = np.array([
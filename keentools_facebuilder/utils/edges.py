@@ -20,6 +20,7 @@ import numpy as np
 import bpy
 import gpu
 import bgl
+from gpu.types import GPUBatch, GPUIndexBuf, GPUVertBuf, GPUVertFormat
 from gpu_extras.batch import batch_for_shader
 from . shaders import simple_fill_vertex_shader, \
     black_fill_fragment_shader, residual_vertex_shader, \
@@ -57,6 +58,13 @@ class FBEdgeShaderBase:
         self.edges_indices = []
         self.edges_colors = []
         self.vertices_colors = []
+        # Flat array of vertex indices for each edge end (topology)
+        self.edges_vertex_indices = np.empty(0, dtype=np.int32)
+        # Special parts of edges_vertices. Calculated once per topology
+        self.special_edges_mask = None
+        # Last arguments, used again when topology is changed
+        self._special_pairs = None
+        self._color_args = ()
         # Check if blender started in background mode
         if not bpy.app.background:
             self.init_shaders()
@@ -64,16 +72,43 @@ class FBEdgeShaderBase:
     def is_working(self):
         return not (self.draw_handler is None)
 
-    def init_color_data(self, color=(0.5, 0.0, 0.7, 0.2)):
-        self.edges_colors = np.full(
-            (len(self.edges_vertices), 4), color).tolist()
+    def init_color_data(self, color=(0.5, 0.0, 0.7, 0.2),
+                        special_color=None):
+        """ Special color is applied by special_edges_mask if it exists """
+        self._color_args = (color, special_color)
+        count = len(self.edges_vertices)
+        if not isinstance(self.edges_colors, np.ndarray) or \
+                self.edges_colors.shape != (count, 4):
+            self.edges_colors = np.empty((count, 4), dtype=np.float32)
+
+        if special_color is None or self.special_edges_mask is None or \
+                len(self.special_edges_mask) != count:
+            self.edges_colors[:] = color
+            return
+
+        self.edges_colors[:] = np.where(
+            self.special_edges_mask[:, np.newaxis],
+            np.array(special_color, dtype=np.float32),
+            np.array(color, dtype=np.float32))
+
+    def init_special_edges_mask(self, pairs):
+        """ Pairs is (K, 2) array of vertex indices. Mask has value
+        for each edge end as edges_vertices array """
+        self._special_pairs = pairs
+        edges = self.edges_vertex_indices.reshape((-1, 2))
+        if len(edges) == 0 or len(pairs) == 0:
+            self.special_edges_mask = np.zeros(len(edges) * 2, dtype=np.bool_)
+            return
 
-    def init_special_areas(self, mesh, pairs, color=(0.5, 0.0, 0.7, 0.2)):
-        for i, edge in enumerate(mesh.edges):
-            vv = edge.vertices
-            if ((vv[0], vv[1]) in pairs) or ((vv[1], vv[0]) in pairs):
-                self.edges_colors[i * 2] = color
-                self.edges_colors[i * 2 + 1] = color
+        pairs = np.asarray(pairs, dtype=np.int64).reshape((-1, 2))
+        base = max(int(edges.max()), int(pairs.max())) + 1
+
+        def _undirected_keys(arr):
+            return np.minimum(arr[:, 0], arr[:, 1]).astype(np.int64) * base \
+                   + np.maximum(arr[:, 0], arr[:, 1])
+
+        edge_mask = np.isin(_undirected_keys(edges), _undirected_keys(pairs))
+        self.special_edges_mask = np.repeat(edge_mask, 2)
 
     def register_handler(self, args):
         if self.draw_handler is not None:
@@ -162,6 +197,17 @@ class FBEdgeShader2D(FBEdgeShaderBase):
 
 class FBEdgeShader3D(FBEdgeShaderBase):
     """ Wireframe drawing class """
+    def __init__(self):
+        self.pos_format = None
+        self.color_format = None
+        self.fill_indices_buffer = None
+        self.edges_colors_buffer = None
+        # Index and color buffers do not match positions after
+        # topology change, so create_batches is needed
+        self.batches_outdated = False
+        self.local_vertices = np.empty((0, 3), dtype=np.float32)
+        super().__init__()
+
     def draw_callback(self, op, context):
         # Force Stop
         if self.is_handler_list_empty():
@@ -195,19 +241,39 @@ class FBEdgeShader3D(FBEdgeShaderBase):
         bgl.glDisable(bgl.GL_DEPTH_TEST)
 
     def create_batches(self):
+        """ Full batch creation. Colors and indices are uploaded here """
         if bpy.app.background:
             return
-        self.fill_batch = batch_for_shader(
-                    self.fill_shader, 'TRIS',
-                    {"pos": self.vertices},
-                    indices=self.indices,
-                )
+        self.batches_outdated = False
+        self.fill_indices_buffer = GPUIndexBuf(type='TRIS', seq=self.indices)
 
-        # Our shader batch
-        self.line_batch = batch_for_shader(
-            self.line_shader, 'LINES',
-            {"pos": self.edges_vertices, "color": self.edges_colors},
-            indices=self.edges_indices)
+        self.edges_colors_buffer = GPUVertBuf(self.color_format,
+                                              len(self.edges_colors))
+        self.edges_colors_buffer.attr_fill('color', self.edges_colors)
+
+        self.update_position_batches()
+
+    def update_position_batches(self):
+        """ Positions only update. Topology and colors buffers are reused.
+        Vertex buffers are uploaded as static ones in Blender,
+        so only new position buffers are created here """
+        if bpy.app.background:
+            return
+        if self.batches_outdated or self.fill_indices_buffer is None:
+            self.create_batches()
+            return
+        self.fill_batch = GPUBatch(
+            type='TRIS', buf=self._position_buffer(self.vertices),
+            elem=self.fill_indices_buffer)
+
+        self.line_batch = GPUBatch(
+            type='LINES', buf=self._position_buffer(self.edges_vertices))
+        self.line_batch.vertbuf_add(self.edges_colors_buffer)
+
+    def _position_buffer(self, verts):
+        vbo = GPUVertBuf(self.pos_format, len(verts))
+        vbo.attr_fill('pos', verts)
+        return vbo
 
     def init_shaders(self):
         self.fill_shader = gpu.types.GPUShader(
@@ -215,37 +281,67 @@ class FBEdgeShader3D(FBEdgeShaderBase):
 
         self.line_shader = gpu.shader.from_builtin('3D_SMOOTH_COLOR')
 
+        self.pos_format = GPUVertFormat()
+        self.pos_format.attr_add(id='pos', comp_type='F32', len=3,
+                                 fetch_mode='FLOAT')
+        self.color_format = GPUVertFormat()
+        self.color_format.attr_add(id='color', comp_type='F32', len=4,
+                                   fetch_mode='FLOAT')
+
     def init_geom_data(self, obj):
+        self.init_topology(obj)
+        self.update_positions(obj)
+
+    def init_topology(self, obj):
+        """ Should be called once per topology (by ex. on pinmode start) """
         mesh = obj.data
         mesh.calc_loop_triangles()
 
-        verts = np.empty((len(mesh.vertices), 3), 'f')
-        indices = np.empty((len(mesh.loop_triangles), 3), 'i')
+        indices = np.empty((len(mesh.loop_triangles), 3), dtype=np.int32)
+        mesh.loop_triangles.foreach_get('vertices', indices.ravel())
+        self.indices = indices
+
+        edges = np.empty((len(mesh.edges), 2), dtype=np.int32)
+        mesh.edges.foreach_get('vertices', edges.ravel())
+        self.edges_vertex_indices = edges.ravel()
+        self.special_edges_mask = None
+
+        # Preallocated buffers for positions update
+        verts_count = len(mesh.vertices)
+        self.local_vertices = np.empty((verts_count, 3), dtype=np.float32)
+        self.vertices = np.empty((verts_count, 3), dtype=np.float32)
+        self.edges_vertices = np.empty(
+            (len(self.edges_vertex_indices), 3), dtype=np.float32)
+
+    def update_positions(self, obj):
+        """ Per-frame update. Topology, special edges and colors
+        are rebuilt if vertices or edges count is changed """
+        mesh = obj.data
+        topology_changed = \
+            len(mesh.vertices) != len(self.local_vertices) or \
+            len(mesh.edges) * 2 != len(self.edges_vertex_indices)
+        if topology_changed:
+            self.init_topology(obj)
 
-        mesh.vertices.foreach_get(
-            "co", np.reshape(verts, len(mesh.vertices) * 3))
-        mesh.loop_triangles.foreach_get(
-            "vertices", np.reshape(indices, len(mesh.loop_triangles) * 3))
+        mesh.vertices.foreach_get('co', self.local_vertices.ravel())
 
         # Object matrix usage
-        m = np.array(obj.matrix_world, dtype=np.float32).transpose()
-        vv = np.ones((len(mesh.vertices), 4), dtype=np.float32)
-        vv[:, :-1] = verts
-        vv = vv @ m
-        # Transformed vertices
-        verts = vv[:, :3]
-
-        self.vertices = verts
-        self.indices = indices
+        m = np.array(obj.matrix_world, dtype=np.float32)
+        np.matmul(self.local_vertices, m[:3, :3].T, out=self.vertices)
+        self.vertices += m[:3, 3]
 
-        edges = np.empty((len(mesh.edges), 2), 'i')
-        mesh.edges.foreach_get(
-            "vertices", np.reshape(edges, len(mesh.edges) * 2))
+        np.take(self.vertices, self.edges_vertex_indices, axis=0,
+                out=self.edges_vertices)
 
-        self.edges_vertices = self.vertices[edges.ravel()]
-        # self.init_edge_indices(obj)
+        if topology_changed:
+            self.init_edge_indices(obj)
+            if self._special_pairs is not None:
+                self.init_special_edges_mask(self._special_pairs)
+            self.init_color_data(*self._color_args)
+            self.batches_outdated = True
 
     # Separated to
     def init_edge_indices(self, obj):
-        self.edges_indices = np.arange(len(self.edges_vertices) * 2).reshape(
-            len(self.edges_vertices), 2).tolist()
+        self.edges_indices = np.arange(
+            len(self.edges_vertices) * 2, dtype=np.int32).reshape(
+            len(self.edges_vertices), 2)
@@ -0,0 +1,160 @@
+# ##### BEGIN GPL LICENSE BLOCK #####
+# KeenTools for blender is a blender addon for using KeenTools in Blender.
+# Copyright (C) 2019  KeenTools
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+# ##### END GPL LICENSE BLOCK #####
+
+
+import json
+import logging
+import os
+import threading
+from collections import OrderedDict
+
+import bpy
+
+from .. config import Config
+
+
+def _file_key(filepath):
+    """ (absolute path, size, mtime_ns) or None if file is not available """
+    path = os.path.normcase(os.path.abspath(filepath))
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return path, stat.st_size, stat.st_mtime_ns
+
+
+class FBExifCache:
+    """ Persistent LRU cache of extracted EXIF data.
+    Stored as JSON lines in user config directory, new records are
+    appended and the file is rewritten when it gets too long """
+    _entries = None
+    _file_lines = 0
+    _hits = 0
+    _misses = 0
+    _lock = threading.Lock()
+    # Resolved in main thread, workers of read_exif_batch have no bpy access
+    _filepath = None
+
+    @classmethod
+    def cache_filepath(cls):
+        if cls._filepath is None:
+            cls._filepath = os.path.join(
+                bpy.utils.user_resource('CONFIG', path=Config.exif_cache_dir),
+                Config.exif_cache_filename)
+        return cls._filepath
+
+    @classmethod
+    def _load(cls):
+        logger = logging.getLogger(__name__)
+        cls.cache_filepath()
+        cls._entries = OrderedDict()
+        cls._file_lines = 0
+        try:
+            with open(cls.cache_filepath(), 'r', encoding='utf-8') as f:
+                for line in f:
+                    cls._file_lines += 1
+                    try:
+                        path, size, mtime_ns, data = json.loads(line)
+                    except ValueError:
+                        continue
+                    key = (path, size, mtime_ns)
+                    cls._entries[key] = data
+                    cls._entries.move_to_end(key)
+        except FileNotFoundError:
+            pass
+        except OSError as err:
+            logger.error('EXIF CACHE READ ERROR: {}'.format(str(err)))
+        cls._trim()
+
+    @classmethod
+    def _get_entries(cls):
+        if cls._entries is None:
+            cls._load()
+        return cls._entries
+
+    @classmethod
+    def get(cls, filepath):
+        key = _file_key(filepath)
+        with cls._lock:
+            data = None if key is None else cls._get_entries().get(key)
+            if data is None:
+                cls._misses += 1
+                return None
+            cls._hits += 1
+            cls._entries.move_to_end(key)
+            return dict(data)
+
+    @classmethod
+    def put(cls, filepath, data):
+        key = _file_key(filepath)
+        if key is None:
+            return
+        with cls._lock:
+            entries = cls._get_entries()
+            entries[key] = dict(data)
+            entries.move_to_end(key)
+            if not cls._trim():
+                cls._append(key, data)
+
+    @classmethod
+    def _append(cls, key, data):
+        logger = logging.getLogger(__name__)
+        try:
+            os.makedirs(os.path.dirname(cls.cache_filepath()), exist_ok=True)
+            with open(cls.cache_filepath(), 'a', encoding='utf-8') as f:
+                f.write(json.dumps([*key, data]) + '\n')
+            cls._file_lines += 1
+        except OSError as err:
+            logger.error('EXIF CACHE WRITE ERROR: {}'.format(str(err)))
+
+    @classmethod
+    def _trim(cls):
+        """ Drops least recently used entries. True if file was rewritten """
+        while len(cls._entries) > Config.exif_cache_max_entries:
+            cls._entries.popitem(last=False)
+        if cls._file_lines <= 2 * max(len(cls._entries), 1):
+            return False
+        cls._rewrite()
+        return True
+
+    @classmethod
+    def _rewrite(cls):
+        logger = logging.getLogger(__name__)
+        filepath = cls.cache_filepath()
+        try:
+            os.makedirs(os.path.dirname(filepath), exist_ok=True)
+            with open(filepath + '.tmp', 'w', encoding='utf-8') as f:
+                for key, data in cls._entries.items():
+                    f.write(json.dumps([*key, data]) + '\n')
+            os.replace(filepath + '.tmp', filepath)
+            cls._file_lines = len(cls._entries)
+        except OSError as err:
+            logger.error('EXIF CACHE WRITE ERROR: {}'.format(str(err)))
+
+    @classmethod
+    def clear(cls):
+        with cls._lock:
+            cls._entries = OrderedDict()
+            cls._rewrite()
+
+    @classmethod
+    def stats(cls):
+        with cls._lock:
+            return {'entries': len(cls._get_entries()),
+                    'hits': cls._hits,
+                    'misses': cls._misses}
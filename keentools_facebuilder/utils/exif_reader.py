@@ -18,14 +18,25 @@
 
 import logging
 import os
+from concurrent.futures import ThreadPoolExecutor
 
-import numpy as np
-
-from ..blender_independent_packages.exifread import process_file
-from ..blender_independent_packages.exifread import \
-    DEFAULT_STOP_TAG, FIELD_TYPES
+from ..blender_independent_packages.exifread import process_file_tags
+from ..blender_independent_packages.exifread import FIELD_TYPES
 
 from ..config import Config, get_main_settings
+from .exif_cache import FBExifCache
+from .image_groups import FBImageGroupIndex, FBImageGroups
+from .images import image_size
+
+
+# All tags used by _read_exif
+_EXIF_TAGS = (
+    'EXIF FocalLength', 'EXIF FocalLengthIn35mmFilm',
+    'EXIF FocalPlaneXResolution', 'EXIF FocalPlaneYResolution',
+    'EXIF FocalPlaneResolutionUnit',
+    'EXIF ExifImageWidth', 'EXIF ExifImageLength',
+    'Image ImageWidth', 'Image ImageLength',
+    'Image Orientation', 'Image Make', 'Image Model')
 
 
 # Convert frac record like '16384/32768' to float 0.5
@@ -54,7 +65,7 @@ def _get_safe_exif_param_num(p, data):
 
 def _get_safe_exif_param_str(p, data):
     if data is not None and p in data.keys():
-        return data[p]
+        return str(data[p])
     return None
 
 
@@ -115,15 +126,13 @@ def get_sensor_size_35mm_equivalent(head):
     return w, h
 
 
-def _read_exif(filepath):
+def _read_exif_from_file(filepath):
     logger = logging.getLogger(__name__)
 
     status = False
     try:
         with open(str(filepath), 'rb') as img_file:
-            data = process_file(img_file, stop_tag=DEFAULT_STOP_TAG,
-                                details=True, strict=False,
-                                debug=False)
+            data = process_file_tags(img_file, _EXIF_TAGS, strict=False)
             status = True
 
         # This call is needed only for full EXIF review
@@ -156,6 +165,40 @@ def _read_exif(filepath):
     }
 
 
+def _read_exif(filepath):
+    data = FBExifCache.get(filepath)
+    if data is not None:
+        return data
+    data = _read_exif_from_file(filepath)
+    if data['status']:
+        FBExifCache.put(filepath, data)
+    return data
+
+
+def _probe_and_read_exif(filepath):
+    """ None for missing file. Safe to call from worker threads """
+    if not os.path.isfile(filepath):
+        return None
+    return _read_exif(filepath)
+
+
+def read_exif_batch(filepaths, workers=Config.exif_import_workers):
+    """ EXIF data for every file (None if file is missing) in the same
+    order. Files are probed and parsed on a thread pool, no bpy access """
+    logger = logging.getLogger(__name__)
+    if len(filepaths) == 0:
+        return []
+    # Cache is loaded here in main thread, workers only hit the lock
+    FBExifCache.stats()
+    if workers <= 1 or len(filepaths) == 1:
+        return [_probe_and_read_exif(path) for path in filepaths]
+    with ThreadPoolExecutor(max_workers=min(workers, len(filepaths)),
+                            thread_name_prefix='fb_exif') as executor:
+        res = list(executor.map(_probe_and_read_exif, filepaths))
+    logger.debug('EXIF BATCH: {} FILES'.format(len(res)))
+    return res
+
+
 def _safe_parameter(data, name):
     if data[name] is not None:
         return data[name]
@@ -263,7 +306,7 @@ def _exif_sizes_message(headnum, image):
         rw = -1
         rh = -1
     else:
-        rw, rh = image.size
+        rw, rh = image_size(image)
 
     iw = head.exif.image_width
     ih = head.exif.image_length
@@ -331,7 +374,10 @@ def read_exif_to_camera(headnum, camnum, filepath):
     camera = settings.get_camera(headnum, camnum)
     if camera is None:
         return False
-    exif_data = _read_exif(filepath)
+    return apply_exif_to_camera(camera, _read_exif(filepath))
+
+
+def apply_exif_to_camera(camera, exif_data):
     _init_exif_settings(camera.exif, exif_data)
     camera.exif.info_message = _exif_info_message(camera.exif, exif_data)
     return exif_data['status']
@@ -439,32 +485,104 @@ def copy_exif_parameters_from_camera_to_head(camera, head):
 
 
 def _detect_image_groups_by_exif(head, hash_func=_exif_and_size_hash_string):
-    hashes = [hash_func(cam) for cam in head.cameras]
-    unique_hashes = []
-    _ = [unique_hashes.append(x) for x in hashes if x not in unique_hashes]
-    return [unique_hashes.index(x) + 1 for x in hashes]
+    group_nums = {}
+    res = []
+    for cam in head.cameras:
+        x = hash_func(cam)
+        if x not in group_nums:
+            group_nums[x] = len(group_nums) + 1
+        res.append(group_nums[x])
+    return res
+
+
+def _camera_group_hashes(camera, empty_exif_hash):
+    """ (full hash or None if camera has no EXIF, image size hash) """
+    exif_hash = _exif_hash_string(camera.exif)
+    size_hash = _image_size_hash_string(camera)
+    if exif_hash == empty_exif_hash:
+        return None, size_hash
+    return "{}#{}".format(exif_hash, size_hash), size_hash
+
+
+def _build_image_group_index(head):
+    empty_exif_hash = _undefined_exif_hash_string()
+    hashes = [_camera_group_hashes(cam, empty_exif_hash)
+              for cam in head.cameras]
+    index = FBImageGroupIndex()
+    index.build([cam.image_group for cam in head.cameras],
+                [h for h, _ in hashes], [s for _, s in hashes])
+    FBImageGroups.put(head, index)
+    return index
+
+
+def _get_image_group_index(head):
+    index = FBImageGroups.get(head)
+    if index is None:
+        index = _build_image_group_index(head)
+    return index
+
+
+def _apply_image_group_changes(head, index, changes):
+    for camnum, group_num in changes.items():
+        head.cameras[camnum].image_group = group_num
+    head.show_image_groups = index.show_groups()
 
 
 def is_size_compatible_with_group(head, camera, groupnum):
-    def _group_size_hash(cur_head, gnum):
-        for cam in cur_head.cameras:
-            if cam.image_group == gnum:
-                return _image_size_hash_string(cam)
-        return None
+    index = _get_image_group_index(head)
+    return index.is_size_compatible(_image_size_hash_string(camera), groupnum)
+
+
+def add_camera_to_image_groups(head, camnum):
+    """ Last camera is just added with group 0 """
+    index = FBImageGroups.get(head, added=True)
+    if index is None or camnum != len(index.groups):
+        update_image_groups(head)
+        return
+    h, size_hash = _camera_group_hashes(head.get_camera(camnum),
+                                        _undefined_exif_hash_string())
+    _apply_image_group_changes(head, index, index.add(h, size_hash))
+
+
+def remove_camera_from_image_groups(head, camnum):
+    """ Camera camnum is already removed from head """
+    index = FBImageGroups.get(head, removed=camnum)
+    if index is None:
+        update_image_groups(head)
+        return
+    _apply_image_group_changes(head, index, index.remove(camnum))
+
+
+def update_camera_image_group(head, camnum, reset=False):
+    """ Camera image or EXIF is changed. Reset moves it out of its group
+    into one found by EXIF """
+    index = _get_image_group_index(head)
+    h, size_hash = _camera_group_hashes(head.get_camera(camnum),
+                                        _undefined_exif_hash_string())
+    _apply_image_group_changes(
+        head, index, index.update(camnum, h, size_hash, reset=reset))
+
 
-    current_hash = _image_size_hash_string(camera)
-    group_hash = _group_size_hash(head, groupnum)
-    return group_hash is None or group_hash == current_hash
+def set_camera_image_group(head, camnum, groupnum):
+    """ Manual regrouping. Group -1 excludes camera from grouping """
+    index = _get_image_group_index(head)
+    index.set_group(camnum, groupnum)
+    head.get_camera(camnum).image_group = groupnum
+
+
+def new_image_group_num(head):
+    return _get_image_group_index(head).new_group()
 
 
 def update_image_groups(head):
+    """ Full groups rebuild """
     def _perform_already_defined_groups():
         for i, group_num in enumerate(image_groups_old):
             if group_num <= 0:
                 continue
             if group_num not in in_group_counter.keys():
                 in_group_counter[group_num] = 1
-                if exif_hashes[i] != empty_exif_hash:
+                if exif_hashes[i] is not None:
                     if full_hashes[i] not in used_full_hashes.keys():
                         used_full_hashes[full_hashes[i]] = group_num
             else:
@@ -485,7 +603,7 @@ def update_image_groups(head):
             if group_num != 0:  # Group already defined
                 image_groups_new[i] = group_num
                 continue
-            if exif_hashes[i] == empty_exif_hash:
+            if exif_hashes[i] is None:
                 image_groups_new[i] = current_group_num
                 in_group_counter[current_group_num] = 1
                 current_group_num += 1
@@ -518,10 +636,15 @@ def update_image_groups(head):
                     current_group_num += 1
 
     in_group_counter = {}
-    exif_hashes = [_exif_hash_string(cam.exif) for cam in head.cameras]
-    full_hashes = [_exif_and_size_hash_string(cam) for cam in head.cameras]
-    image_groups_old = [cam.image_group for cam in head.cameras]
     empty_exif_hash = _undefined_exif_hash_string()
+    # Every camera is hashed once, exif hash is None for undefined EXIF
+    hashes = [_camera_group_hashes(cam, empty_exif_hash)
+              for cam in head.cameras]
+    exif_hashes = [h for h, _ in hashes]
+    size_hashes = [s for _, s in hashes]
+    full_hashes = ["{}#{}".format(empty_exif_hash, s) if h is None else h
+                   for h, s in hashes]
+    image_groups_old = [cam.image_group for cam in head.cameras]
     used_full_hashes = {}
     used_group_nums = {}
 
@@ -531,11 +654,13 @@ def update_image_groups(head):
     _renumber()
 
     for i, cam in enumerate(head.cameras):
-        cam.image_group = image_groups_new[i]
+        if cam.image_group != image_groups_new[i]:
+            cam.image_group = image_groups_new[i]
 
-    unique_groups = np.unique([x for x in image_groups_new if x >=0],
-                              return_counts=False)
-    head.show_image_groups = len(list(unique_groups)) > 1
+    index = FBImageGroupIndex()
+    index.build(image_groups_new, exif_hashes, size_hashes)
+    FBImageGroups.put(head, index)
+    head.show_image_groups = index.show_groups()
 
 
 def read_exif_from_camera(headnum, camnum):
@@ -554,4 +679,5 @@ def read_exif_from_camera(headnum, camnum):
 
     status = read_exif_to_camera(headnum, camnum, abspath)
     update_exif_sizes_message(headnum, camera.cam_image)
+    update_camera_image_group(head, camnum)
     return status
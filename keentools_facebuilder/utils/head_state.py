@@ -0,0 +1,72 @@
+# ##### BEGIN GPL LICENSE BLOCK #####
+# KeenTools for blender is a blender addon for using KeenTools in Blender.
+# Copyright (C) 2019  KeenTools
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+# ##### END GPL LICENSE BLOCK #####
+
+
+""" Binary container for builder state and camera matrices.
+Legacy plain string / hex string values are accepted on read """
+import struct
+import zlib
+
+import numpy as np
+
+
+_SERIAL_MAGIC = b'KTFB'
+SERIAL_VERSION = 1
+# magic, version, uncompressed size
+_SERIAL_HEADER = struct.Struct('<4sBI')
+_COMPRESS_LEVEL = 6
+
+
+def pack_serial(serial_str):
+    raw = serial_str.encode('utf-8')
+    return _SERIAL_HEADER.pack(_SERIAL_MAGIC, SERIAL_VERSION, len(raw)) + \
+        zlib.compress(raw, _COMPRESS_LEVEL)
+
+
+def unpack_serial(data):
+    if isinstance(data, str):
+        # Legacy format
+        return data
+    data = bytes(data)
+    if len(data) < _SERIAL_HEADER.size:
+        raise ValueError('Head state is too short')
+    magic, version, size = _SERIAL_HEADER.unpack_from(data)
+    if magic != _SERIAL_MAGIC:
+        raise ValueError('Unknown head state format')
+    if version > SERIAL_VERSION:
+        raise ValueError('Unsupported head state version: {}'.format(version))
+    raw = zlib.decompress(data[_SERIAL_HEADER.size:])
+    if len(raw) != size:
+        raise ValueError('Head state is corrupted')
+    return raw.decode('utf-8')
+
+
+def pack_matrix(arr):
+    return np.asarray(arr, dtype=np.float32).tobytes()
+
+
+def unpack_matrix(data):
+    if isinstance(data, str):
+        # Legacy hex format
+        if len(data) == 0:
+            return np.eye(4)
+        data = bytes.fromhex(data)
+    data = bytes(data)
+    if len(data) == 0:
+        return np.eye(4)
+    return np.frombuffer(data, dtype=np.float32).reshape((4, 4))
@@ -0,0 +1,230 @@
+# ##### BEGIN GPL LICENSE BLOCK #####
+# KeenTools for blender is a blender addon for using KeenTools in Blender.
+# Copyright (C) 2019  KeenTools
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+# ##### END GPL LICENSE BLOCK #####
+
+
+import logging
+
+import bpy
+from bpy.app.handlers import persistent
+import numpy as np
+
+
+class FBImageGroupIndex:
+    """ Image groups of one head.
+    Maps camera hash to group and group to members count, so a camera
+    change is applied without hashing other cameras.
+    Hash is None when camera has no EXIF """
+    def __init__(self):
+        self.groups = []  # image_group of every camera
+        self.hashes = []
+        self.size_hashes = []
+        self.hash_groups = {}  # hash -> group
+        self.group_hashes = {}  # group -> hashes mapped to it
+        self.group_sizes = {}  # group -> image size hash
+        self.counts = {}  # group -> members count, for groups >= 0
+        self.singles = {}  # hash -> camnum of the only camera in group 0
+
+    def build(self, groups, hashes, size_hashes):
+        self.__init__()
+        self.groups = list(groups)
+        self.hashes = list(hashes)
+        self.size_hashes = list(size_hashes)
+        for camnum in range(len(self.groups)):
+            self._register(camnum)
+
+    def _register(self, camnum):
+        group = self.groups[camnum]
+        if group < 0:
+            return
+        self.counts[group] = self.counts.get(group, 0) + 1
+        h = self.hashes[camnum]
+        if group == 0:
+            if h is not None:
+                self.singles[h] = camnum
+            return
+        self.group_sizes.setdefault(group, self.size_hashes[camnum])
+        if h is not None and h not in self.hash_groups:
+            self.hash_groups[h] = group
+            self.group_hashes.setdefault(group, set()).add(h)
+
+    def _unregister(self, camnum):
+        group = self.groups[camnum]
+        if group < 0:
+            return
+        self.counts[group] -= 1
+        h = self.hashes[camnum]
+        if group == 0:
+            if self.counts[group] == 0:
+                del self.counts[group]
+            if h is not None and self.singles.get(h) == camnum:
+                del self.singles[h]
+            return
+        if self.counts[group] == 0:
+            del self.counts[group]
+            self.group_sizes.pop(group, None)
+            for gh in self.group_hashes.pop(group, ()):
+                del self.hash_groups[gh]
+
+    def _set(self, camnum, group, changes):
+        if self.groups[camnum] != group:
+            self.groups[camnum] = group
+            changes[camnum] = group
+
+    def _place(self, camnum, changes):
+        """ Group 0 camera joins a group with the same hash """
+        h = self.hashes[camnum]
+        if h is not None:
+            if h in self.hash_groups:
+                self._set(camnum, self.hash_groups[h], changes)
+            elif h in self.singles:
+                other = self.singles[h]
+                self._unregister(other)
+                group = self.new_group()
+                self._set(other, group, changes)
+                self._register(other)
+                self._set(camnum, group, changes)
+        self._register(camnum)
+
+    def _collapse(self, group, changes):
+        """ Group with one member left is dissolved """
+        if group <= 0 or self.counts.get(group) != 1:
+            return
+        camnum = self.groups.index(group)
+        self._unregister(camnum)
+        self._set(camnum, 0, changes)
+        self._place(camnum, changes)
+
+    def new_group(self):
+        return max(self.counts.keys(), default=0) + 1
+
+    def add(self, h, size_hash):
+        """ New camera appended with group 0.
+        Returns {camnum: group} for cameras with changed group """
+        changes = {}
+        self.groups.append(0)
+        self.hashes.append(h)
+        self.size_hashes.append(size_hash)
+        self._place(len(self.groups) - 1, changes)
+        return changes
+
+    def remove(self, camnum):
+        """ Camera removed, numbers of next cameras are shifted """
+        changes = {}
+        group = self.groups[camnum]
+        self._unregister(camnum)
+        del self.groups[camnum]
+        del self.hashes[camnum]
+        del self.size_hashes[camnum]
+        for h, num in self.singles.items():
+            if num > camnum:
+                self.singles[h] = num - 1
+        self._collapse(group, changes)
+        return changes
+
+    def update(self, camnum, h, size_hash, reset=False):
+        """ Camera hash is changed (image or EXIF re-read).
+        Camera stays in its group unless reset is requested """
+        changes = {}
+        group = self.groups[camnum]
+        self._unregister(camnum)
+        self.hashes[camnum] = h
+        self.size_hashes[camnum] = size_hash
+        if reset and group != 0:
+            self._set(camnum, 0, changes)
+            self._collapse(group, changes)
+        if self.groups[camnum] == 0:
+            self._place(camnum, changes)
+        else:
+            self._register(camnum)
+        return changes
+
+    def set_group(self, camnum, group):
+        """ Manual regrouping, other cameras are not changed """
+        self._unregister(camnum)
+        self.groups[camnum] = group
+        self._register(camnum)
+
+    def is_size_compatible(self, size_hash, group):
+        group_size = self.group_sizes.get(group)
+        return group_size is None or group_size == size_hash
+
+    def show_groups(self):
+        return len(self.counts) > 1
+
+
+class FBImageGroups:
+    """ Group indices of all heads, valid while image_group values
+    of head cameras are the same as in index """
+    _indices = {}
+
+    @staticmethod
+    def _current_groups(head):
+        groups = np.empty(len(head.cameras), dtype=np.int32)
+        head.cameras.foreach_get('image_group', groups)
+        return groups
+
+    @classmethod
+    def get(cls, head, added=False, removed=None):
+        """ Index of head or None if it is missing or outdated.
+        Last camera is skipped in check when it is just added,
+        removed camnum is skipped in index when camera is just deleted """
+        index = cls._indices.get(head.as_pointer())
+        if index is None:
+            return None
+        current = cls._current_groups(head)
+        if added:
+            current = current[:-1]
+        expected = index.groups
+        if removed is not None:
+            if removed >= len(expected):
+                return None
+            expected = expected[:removed] + expected[removed + 1:]
+        if not np.array_equal(expected, current):
+            return None
+        return index
+
+    @classmethod
+    def put(cls, head, index):
+        cls._indices[head.as_pointer()] = index
+
+    @classmethod
+    def clear(cls):
+        logger = logging.getLogger(__name__)
+        logger.debug('IMAGE GROUPS INDICES CLEAR')
+        cls._indices.clear()
+
+    @classmethod
+    def register_handlers(cls):
+        bpy.app.handlers.load_post.append(_clear_image_groups_handler)
+        bpy.app.handlers.undo_post.append(_clear_image_groups_handler)
+        bpy.app.handlers.redo_post.append(_clear_image_groups_handler)
+
+    @classmethod
+    def unregister_handlers(cls):
+        for handlers in (bpy.app.handlers.load_post,
+                         bpy.app.handlers.undo_post,
+                         bpy.app.handlers.redo_post):
+            if _clear_image_groups_handler in handlers:
+                handlers.remove(_clear_image_groups_handler)
+
+
+@persistent
+def _clear_image_groups_handler(*args):
+    """ Head pointers and camera hashes are not valid after file load
+    or undo, indices are rebuilt on next use """
+    FBImageGroups.clear()
@@ -0,0 +1,108 @@
+# ##### BEGIN GPL LICENSE BLOCK #####
+# KeenTools for blender is a blender addon for using KeenTools in Blender.
+# Copyright (C) 2019  KeenTools
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+# ##### END GPL LICENSE BLOCK #####
+
+
+import bpy
+import numpy as np
+
+from ..blender_independent_packages.image_probe import probe_image
+
+
+# Image.pixels has foreach_get/foreach_set since Blender 2.83
+_PIXELS_FOREACH = bpy.app.version >= (2, 83, 0)
+
+
+class FBImageBufferPool:
+    """ Reusable float32 pixel buffers grouped by shape """
+    _free = {}
+
+    @classmethod
+    def acquire(cls, shape):
+        buffers = cls._free.get(shape)
+        if buffers:
+            return buffers.pop()
+        return np.empty(shape, dtype=np.float32)
+
+    @classmethod
+    def release(cls, buffer):
+        cls._free.setdefault(buffer.shape, []).append(buffer)
+
+    @classmethod
+    def clear(cls):
+        cls._free = {}
+
+    @classmethod
+    def nbytes(cls):
+        return sum(buf.nbytes for buffers in cls._free.values()
+                   for buf in buffers)
+
+
+def image_size(image):
+    """ (width, height) of bpy image. File header is read if pixels
+    are not loaded yet, so image is not decoded just for its size """
+    if image.has_data or image.source != 'FILE' or \
+            image.packed_file is not None:
+        return tuple(image.size[:2])
+    info = probe_image(bpy.path.abspath(image.filepath,
+                                        library=image.library))
+    if info is None:
+        return tuple(image.size[:2])
+    return info.width, info.height
+
+
+def image_to_array(image, buffer=None):
+    """ Image pixels as (h, w, 4) float32 array without Python lists.
+    Buffer is taken from FBImageBufferPool if not provided """
+    w, h = image.size[:2]
+    if buffer is None:
+        buffer = FBImageBufferPool.acquire((h, w, 4))
+    assert(buffer.shape == (h, w, 4) and buffer.dtype == np.float32)
+    if _PIXELS_FOREACH:
+        image.pixels.foreach_get(buffer.ravel())
+    else:
+        buffer.ravel()[:] = image.pixels[:]
+    return buffer
+
+
+def array_to_image(img, image):
+    """ Writes (h, w, 4) array into bpy image of the same size """
+    data = np.ascontiguousarray(img, dtype=np.float32).ravel()
+    if _PIXELS_FOREACH:
+        image.pixels.foreach_set(data)
+    else:
+        image.pixels[:] = data.tolist()
+
+
+def rotate_view(img, orientation):
+    """ Orientation is a number of 90 degree turns. Returns a view """
+    return np.rot90(img, orientation)
+
+
+def downsample(img, factor):
+    """ Block average of (h, w, c) image, size is rounded down.
+    Returns new float32 array or img itself if factor is 1 """
+    if factor <= 1:
+        return img
+    h = img.shape[0] // factor
+    w = img.shape[1] // factor
+    res = np.zeros((h, w, img.shape[2]), dtype=np.float32)
+    for i in range(factor):
+        for j in range(factor):
+            res += img[i:h * factor:factor, j:w * factor:factor]
+    res *= 1.0 / (factor * factor)
+    return res
@@ -17,13 +17,14 @@
 # ##### END GPL LICENSE BLOCK #####
 
 import logging
+import zlib
 from collections import Counter
 
 import bpy
 
 from ..fbloader import FBLoader
 from ..config import Config, get_main_settings, get_operators, ErrorType
-from . import cameras, attrs, coords
+from . import cameras, attrs, coords, head_state
 from .exif_reader import (read_exif_to_camera, auto_setup_camera_from_exif,
                           update_image_groups)
 
@@ -33,7 +34,15 @@ def _is_keentools_object(obj):
 
 
 def _get_serial(obj):
-    return attrs.get_safe_custom_attribute(obj, Config.fb_serial_prop_name[0])
+    serial = attrs.get_safe_custom_attribute(obj, Config.fb_serial_prop_name[0])
+    if serial is None:
+        return None
+    try:
+        return head_state.unpack_serial(serial)
+    except (ValueError, TypeError, zlib.error):
+        logger = logging.getLogger(__name__)
+        logger.error('CANNOT UNPACK HEAD STATE')
+        return None
 
 
 def _get_dir_name(obj):
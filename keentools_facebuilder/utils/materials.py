@@ -16,6 +16,7 @@
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 # ##### END GPL LICENSE BLOCK #####
 import logging
+import os
 
 import bpy
 import numpy as np
@@ -23,6 +24,12 @@ import numpy as np
 from .. config import Config, get_main_settings, get_operators, ErrorType
 from .. fbloader import FBLoader
 from ..utils.coords import projection_matrix
+from ..utils.prefetch import FBFramePrefetcher
+from ..utils.images import (FBImageBufferPool, image_to_array, rotate_view,
+                            downsample, image_size, array_to_image)
+from ..utils.color import srgb_to_linear
+from ..utils.residency import FBImageResidency
+from ..utils import bake_cache
 import keentools_facebuilder.blender_independent_packages.pykeentools_loader as pkt
 
 
@@ -116,7 +123,18 @@ def _remove_bpy_texture_if_exists(tex_name):
         bpy.data.images.remove(existing_tex)
 
 
-def _create_bpy_texture_from_img(img, tex_name):
+def _texture_filepath(tex_name, file_format):
+    """ Texture file path next to .blend or None if it is not saved yet """
+    if not bpy.data.is_saved:
+        return None
+    ext = '.exr' if file_format == 'OPEN_EXR' else '.png'
+    return os.path.join(os.path.dirname(bpy.data.filepath), tex_name + ext)
+
+
+def _create_bpy_texture_from_img(img, tex_name, filepath=None,
+                                 file_format='PNG'):
+    """ Texture is packed if filepath is None
+    else it is saved to file and linked """
     logger = logging.getLogger(__name__)
     assert(len(img.shape) == 3 and img.shape[2] == 4)
 
@@ -124,19 +142,30 @@ def _create_bpy_texture_from_img(img, tex_name):
 
     tex = bpy.data.images.new(
             tex_name, width=img.shape[1], height=img.shape[0],
-            alpha=True, float_buffer=False)
+            alpha=True,
+            float_buffer=filepath is not None and file_format == 'OPEN_EXR')
     tex.colorspace_settings.name = 'Linear'
     assert(tex.name == tex_name)
-    tex.pixels[:] = img.ravel()
+    array_to_image(img, tex)
+
+    if filepath is not None:
+        tex.filepath_raw = filepath
+        tex.file_format = file_format
+        try:
+            tex.save()
+            tex.filepath_raw = bpy.path.relpath(filepath)
+            logger.debug("TEXTURE SAVED: {}".format(filepath))
+            return
+        except RuntimeError as err:
+            logger.error("TEXTURE SAVE ERROR: {}".format(str(err)))
+            tex.filepath_raw = ''
     tex.pack()
 
-    logger.debug("TEXTURE BAKED SUCCESSFULLY")
-
 
 def _cam_image_data_exists(cam):
     if not cam.cam_image:
         return False
-    w, h = cam.cam_image.size[:2]
+    w, h = image_size(cam.cam_image)
     return w > 0 and h > 0
 
 
@@ -150,36 +179,112 @@ def _get_fb_for_bake_tex(headnum, head):
     return fb
 
 
-def _sRGB_to_linear(img):
-    img_rgb = img[:, :, :3]
-    img_rgb[img_rgb < 0.04045] = 25 * img_rgb[img_rgb < 0.04045] / 323
-    img_rgb[img_rgb >= 0.04045] = ((200 * img_rgb[img_rgb >= 0.04045] + 11) / 211) ** (12 / 5)
-    return img
+def _read_cam_image(cam, downscale):
+    img = image_to_array(cam.cam_image)
+    # Pixels are copied, so Blender buffers can be released if needed
+    FBImageResidency.use(cam.cam_image)
+    return img, cam.orientation, not cam.cam_image.is_float, downscale
+
 
+def _prepare_cam_image(data):
+    """ Thread safe part of frame preparation.
+    Returns rotated image view and its pool buffer """
+    img, orientation, is_8bit, downscale = data
+    if downscale > 1:
+        # Averaged pixels are not 8-bit values anymore
+        return srgb_to_linear(rotate_view(
+            downsample(img, downscale), orientation), False), img
+    return srgb_to_linear(rotate_view(img, orientation), is_8bit), img
+
+
+def _cam_image_nbytes(cam):
+    w, h = cam.cam_image.size[:2]
+    return w * h * 4 * np.dtype(np.float32).itemsize
+
+
+def _downscaled_projection(projection, downscale):
+    """ Projection matrix is in image pixels """
+    res = np.array(projection)
+    res[:2] /= downscale
+    return res
+
+
+class _BakeGeometry:
+    """ Head geometry for texture builder frames.
+    Shared by all frames without expressions, memoized by keyframe else """
+    def __init__(self, fb, use_emotions):
+        self.fb = fb
+        self.use_emotions = use_emotions
+        self._geo = {}
+        self.requested = 0
+        self.evaluated = 0
+
+    def get(self, keyframe):
+        self.requested += 1
+        key = keyframe if self.use_emotions else None
+        geo = self._geo.get(key)
+        if geo is None:
+            geo = self.fb.applied_args_model_at(keyframe)
+            self._geo[key] = geo
+            self.evaluated += 1
+        return geo
+
+
+def _create_frame_data_loader(settings, head, camnums, geometry,
+                              downscale=1):
+    prefetcher = FBFramePrefetcher(
+        len(camnums),
+        lambda kf_idx: _read_cam_image(
+            head.cameras[camnums[kf_idx]], downscale),
+        _prepare_cam_image,
+        lambda kf_idx: _cam_image_nbytes(head.cameras[camnums[kf_idx]]))
+    # Image given to builder is kept until the next frame request
+    used_buffers = []
 
-def _create_frame_data_loader(settings, head, camnums, fb):
     def frame_data_loader(kf_idx):
         cam = head.cameras[camnums[kf_idx]]
 
-        w, h = cam.cam_image.size[:2]
-        img = np.rot90(
-            np.asarray(cam.cam_image.pixels[:]).reshape((h, w, 4)),
-            cam.orientation)
-        img = _sRGB_to_linear(img)
+        for buffer in used_buffers:
+            FBImageBufferPool.release(buffer)
+        used_buffers.clear()
+
+        img, buffer = prefetcher.get(kf_idx)
+        used_buffers.append(buffer)
 
         frame_data = pkt.module().texture_builder.FrameData()
-        frame_data.geo = fb.applied_args_model_at(cam.get_keyframe())
+        frame_data.geo = geometry.get(cam.get_keyframe())
         frame_data.image = img
         frame_data.model = cam.get_model_mat()
         frame_data.view = np.eye(4)
-        frame_data.projection = cam.get_projection_matrix()
+        frame_data.projection = _downscaled_projection(
+            cam.get_projection_matrix(), downscale)
 
         return frame_data
 
-    return frame_data_loader
+    return frame_data_loader, prefetcher
 
 
-def bake_tex(headnum, tex_name):
+class FBBakeProgress:
+    """ Cancel request for running texture bake """
+    _cancel_requested = False
+
+    @classmethod
+    def request_cancel(cls):
+        cls._cancel_requested = True
+
+    @classmethod
+    def reset(cls):
+        cls._cancel_requested = False
+
+    @classmethod
+    def is_cancel_requested(cls):
+        return cls._cancel_requested
+
+
+def bake_tex(headnum, tex_name, downscale=1, filepath=None):
+    """ Texture and source frames are downscaled for preview passes.
+    Texture is saved to filepath (PNG or EXR by extension) if it is given.
+    Preview passes are not saved to file and bake cache """
     logger = logging.getLogger(__name__)
     settings = get_main_settings()
     head = settings.get_head(headnum)
@@ -197,25 +302,68 @@ def bake_tex(headnum, tex_name):
     if frames_count == 0:
         logger.debug("NO FRAMES FOR TEXTURE BUILDING")
         return False
-    
+
+    preview = downscale > 1
+    file_format = settings.tex_file_format
+    if filepath is not None:
+        file_format = 'OPEN_EXR' \
+            if filepath.lower().endswith('.exr') else 'PNG'
+    elif settings.tex_save_to_file and not preview:
+        filepath = _texture_filepath(tex_name, file_format)
+        if filepath is None:
+            logger.warning('BLEND FILE IS NOT SAVED. TEXTURE WILL BE PACKED')
+
+    cache_key = None if preview else \
+        bake_cache.make_key(settings, head, camnums, downscale)
+    if cache_key is not None:
+        cached_texture = bake_cache.load(cache_key)
+        if cached_texture is not None:
+            logger.debug('BAKE CACHE HIT: {}'.format(cache_key))
+            _create_bpy_texture_from_img(cached_texture, tex_name,
+                                         filepath, file_format)
+            return True
+
     fb = _get_fb_for_bake_tex(headnum, head)
-    frame_data_loader = _create_frame_data_loader(
-        settings, head, camnums, fb)
+    geometry = _BakeGeometry(fb, head.should_use_emotions())
+    frame_data_loader, prefetcher = _create_frame_data_loader(
+        settings, head, camnums, geometry, downscale)
+    tex_width = max(1, settings.tex_width // downscale)
+    tex_height = max(1, settings.tex_height // downscale)
 
     bpy.context.window_manager.progress_begin(0, 1)
 
     class ProgressCallBack(pkt.module().ProgressCallback):
         def set_progress_and_check_abort(self, progress):
             bpy.context.window_manager.progress_update(progress)
-            return False
+            return FBBakeProgress.is_cancel_requested()
 
     progress_callBack = ProgressCallBack()
-    built_texture = pkt.module().texture_builder.build_texture(
-        frames_count, frame_data_loader, progress_callBack,
-        settings.tex_height, settings.tex_width, settings.tex_face_angles_affection,
-        settings.tex_uv_expand_percents, settings.tex_back_face_culling,
-        settings.tex_equalize_brightness, settings.tex_equalize_colour, settings.tex_fill_gaps)
-    bpy.context.window_manager.progress_end()
-
-    _create_bpy_texture_from_img(built_texture, tex_name)
+    try:
+        built_texture = pkt.module().texture_builder.build_texture(
+            frames_count, frame_data_loader, progress_callBack,
+            tex_height, tex_width, settings.tex_face_angles_affection,
+            settings.tex_uv_expand_percents, settings.tex_back_face_culling,
+            settings.tex_equalize_brightness, settings.tex_equalize_colour, settings.tex_fill_gaps)
+    except Exception:
+        # Builder may stop with an error after cancel
+        if not FBBakeProgress.is_cancel_requested():
+            raise
+        built_texture = None
+    finally:
+        prefetcher.close()
+        FBImageBufferPool.clear()
+        bpy.context.window_manager.progress_end()
+    logger.debug('BAKE FRAMES: {} WAIT FOR FRAMES: {:.3f}s'.format(
+        frames_count, prefetcher.total_wait))
+    logger.debug('BAKE GEOMETRY EVALUATIONS: {} SAVED: {}'.format(
+        geometry.evaluated, geometry.requested - geometry.evaluated))
+
+    if FBBakeProgress.is_cancel_requested() or built_texture is None:
+        logger.debug('TEXTURE BAKING CANCELLED')
+        return False
+
+    if cache_key is not None:
+        bake_cache.store(cache_key, built_texture)
+    _create_bpy_texture_from_img(built_texture, tex_name,
+                                 filepath, file_format)
     return True
@@ -0,0 +1,108 @@
+# ##### BEGIN GPL LICENSE BLOCK #####
+# KeenTools for blender is a blender addon for using KeenTools in Blender.
+# Copyright (C) 2019  KeenTools
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+# ##### END GPL LICENSE BLOCK #####
+
+
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from .. config import Config
+
+
+def _timed_call(func, arg):
+    start = time.perf_counter()
+    res = func(arg)
+    return res, time.perf_counter() - start
+
+
+class FBFramePrefetcher:
+    """ Prepares next frames on a thread pool while current one is used.
+    read_func is called in main thread (bpy access),
+    prepare_func is called in worker threads (numpy only) """
+    def __init__(self, frames_count, read_func, prepare_func, frame_nbytes,
+                 depth=Config.bake_prefetch_frames,
+                 workers=Config.bake_prefetch_workers,
+                 memory_limit=Config.bake_prefetch_memory_limit):
+        self.frames_count = frames_count
+        self.read_func = read_func
+        self.prepare_func = prepare_func
+        self.frame_nbytes = frame_nbytes
+        self.depth = max(0, depth)
+        self.memory_limit = memory_limit
+        # frame index -> (future, nbytes, read time)
+        self._in_flight = {}
+        self._in_flight_bytes = 0
+        self._executor = ThreadPoolExecutor(max_workers=max(1, workers)) \
+            if self.depth > 0 else None
+        self.total_wait = 0.0
+
+    def _submit(self, idx):
+        start = time.perf_counter()
+        data = self.read_func(idx)
+        read_time = time.perf_counter() - start
+        future = self._executor.submit(_timed_call, self.prepare_func, data)
+        nbytes = self.frame_nbytes(idx)
+        self._in_flight[idx] = (future, nbytes, read_time)
+        self._in_flight_bytes += nbytes
+
+    def _schedule(self, first):
+        if self._executor is None:
+            return
+        for idx in range(first, min(first + self.depth, self.frames_count)):
+            if idx in self._in_flight:
+                continue
+            if len(self._in_flight) > 0 and \
+                    self._in_flight_bytes + self.frame_nbytes(idx) > \
+                    self.memory_limit:
+                break
+            self._submit(idx)
+
+    def get(self, idx):
+        logger = logging.getLogger(__name__)
+        item = self._in_flight.pop(idx, None)
+        # Next frames are read before waiting for current one
+        self._schedule(idx + 1)
+
+        if item is None:
+            start = time.perf_counter()
+            data = self.read_func(idx)
+            read_time = time.perf_counter() - start
+            res, prepare_time = _timed_call(self.prepare_func, data)
+            wait_time = prepare_time
+        else:
+            future, nbytes, read_time = item
+            start = time.perf_counter()
+            res, prepare_time = future.result()
+            wait_time = time.perf_counter() - start
+            self._in_flight_bytes -= nbytes
+
+        self.total_wait += wait_time
+        logger.debug('FRAME {} {}: READ {:.3f}s PREPARE {:.3f}s '
+                     'WAIT {:.3f}s'.format(
+                        idx, 'PREFETCHED' if item is not None else 'DIRECT',
+                        read_time, prepare_time, wait_time))
+        return res
+
+    def close(self):
+        for future, _, _ in self._in_flight.values():
+            future.cancel()
+        self._in_flight = {}
+        self._in_flight_bytes = 0
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
@@ -0,0 +1,200 @@
+# ##### BEGIN GPL LICENSE BLOCK #####
+# KeenTools for blender is a blender addon for using KeenTools in Blender.
+# Copyright (C) 2019  KeenTools
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+# ##### END GPL LICENSE BLOCK #####
+
+
+import hashlib
+import logging
+import os
+import tempfile
+
+import bpy
+from bpy.app.handlers import persistent
+
+from .. config import Config, get_addon_preferences
+from .images import image_size
+
+
+_PROXY_EXT = '.jpg'
+# (scene name, headnum, camnum, proxy image name) hidden during file save
+_saved_proxies = []
+
+
+def proxy_dir():
+    return os.path.join(tempfile.gettempdir(), Config.proxy_dir_name)
+
+
+def is_proxy_image(image):
+    if image is None or image.source != 'FILE':
+        return False
+    path = os.path.normpath(bpy.path.abspath(image.filepath))
+    return os.path.dirname(path) == os.path.normpath(proxy_dir())
+
+
+def _remove_unused_proxy(image):
+    logger = logging.getLogger(__name__)
+    if is_proxy_image(image) and image.users == 0:
+        logger.debug('PROXY REMOVED: {}'.format(image.name))
+        bpy.data.images.remove(image)
+
+
+def proxy_size(w, h, long_side):
+    """ Proxy size with the same aspect or None if image is small enough """
+    if max(w, h) <= long_side:
+        return None
+    scale = long_side / max(w, h)
+    return max(1, round(w * scale)), max(1, round(h * scale))
+
+
+def _image_identity(image):
+    path = bpy.path.abspath(image.filepath, library=image.library)
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return os.path.normpath(path), stat.st_size, stat.st_mtime_ns
+
+
+def _write_proxy(image, size, filepath):
+    logger = logging.getLogger(__name__)
+    os.makedirs(os.path.dirname(filepath), exist_ok=True)
+    tmp_filepath = filepath + '.tmp' + _PROXY_EXT
+    tmp = image.copy()
+    try:
+        tmp.scale(*size)
+        tmp.filepath_raw = tmp_filepath
+        tmp.file_format = 'JPEG'
+        tmp.save()
+        os.replace(tmp_filepath, filepath)
+    except (RuntimeError, OSError) as err:
+        logger.error('PROXY WRITE ERROR: {}'.format(str(err)))
+        if os.path.exists(tmp_filepath):
+            os.remove(tmp_filepath)
+        return False
+    finally:
+        bpy.data.images.remove(tmp)
+    logger.debug('PROXY CREATED: {} {}'.format(size, filepath))
+    return True
+
+
+def get_proxy_image(image, long_side):
+    """ Downscaled copy of file image, created in proxy directory on first
+    use. None if image is small enough, packed, float or unreadable """
+    if image is None or image.source != 'FILE' or \
+            image.packed_file is not None or image.is_float:
+        return None
+    w, h = image_size(image)
+    size = proxy_size(w, h, long_side)
+    if size is None:
+        return None
+    identity = _image_identity(image)
+    if identity is None:
+        return None
+
+    key = hashlib.sha1(repr((identity, size)).encode('utf-8')).hexdigest()
+    filepath = os.path.join(proxy_dir(), key + _PROXY_EXT)
+    if not os.path.exists(filepath) and \
+            not _write_proxy(image, size, filepath):
+        return None
+    try:
+        proxy = bpy.data.images.load(filepath, check_existing=True)
+    except RuntimeError:
+        return None
+    proxy.colorspace_settings.name = image.colorspace_settings.name
+    return proxy
+
+
+def pinmode_background(camera):
+    """ Image for camera background in pin mode.
+    Pins are in camera image space, so proxy does not change them """
+    try:
+        prefs = get_addon_preferences()
+        use_proxy = prefs.use_proxy_backgrounds
+        long_side = prefs.proxy_long_side
+    except (KeyError, AttributeError):
+        return camera.cam_image
+    if not use_proxy:
+        return camera.cam_image
+    proxy = get_proxy_image(camera.cam_image, long_side)
+    return camera.cam_image if proxy is None else proxy
+
+
+def restore_background(camera, remove_proxy=True):
+    """ Camera image instead of proxy, so .blend never refers
+    to proxy directory. Returns replaced proxy image or None """
+    background = camera.get_camera_background()
+    if background is None or camera.cam_image is None or \
+            background.image == camera.cam_image:
+        return None
+    proxy = background.image
+    background.image = camera.cam_image
+    if remove_proxy:
+        _remove_unused_proxy(proxy)
+        return None
+    return proxy
+
+
+def _all_heads():
+    for scene in bpy.data.scenes:
+        settings = getattr(scene, Config.addon_global_var_name, None)
+        if settings is None:
+            continue
+        for headnum, head in enumerate(settings.heads):
+            yield scene, headnum, head
+
+
+@persistent
+def _restore_backgrounds_handler(*args):
+    """ Full resolution backgrounds are saved in .blend file.
+    Proxies without users are not written """
+    _saved_proxies.clear()
+    for scene, headnum, head in _all_heads():
+        for camnum, camera in enumerate(head.cameras):
+            if camera.camobj is None:
+                continue
+            proxy = restore_background(camera, remove_proxy=False)
+            if proxy is not None:
+                _saved_proxies.append(
+                    (scene.name, headnum, camnum, proxy.name))
+
+
+@persistent
+def _show_proxies_handler(*args):
+    logger = logging.getLogger(__name__)
+    for scene_name, headnum, camnum, proxy_name in _saved_proxies:
+        scene = bpy.data.scenes.get(scene_name)
+        proxy = bpy.data.images.get(proxy_name)
+        if scene is None or proxy is None:
+            continue
+        settings = getattr(scene, Config.addon_global_var_name)
+        camera = settings.get_camera(headnum, camnum)
+        if camera is not None:
+            camera.show_background_image(proxy)
+    logger.debug('PROXIES SHOWN AFTER SAVE: {}'.format(len(_saved_proxies)))
+    _saved_proxies.clear()
+
+
+def register_handlers():
+    bpy.app.handlers.save_pre.append(_restore_backgrounds_handler)
+    bpy.app.handlers.save_post.append(_show_proxies_handler)
+
+
+def unregister_handlers():
+    if _restore_backgrounds_handler in bpy.app.handlers.save_pre:
+        bpy.app.handlers.save_pre.remove(_restore_backgrounds_handler)
+    if _show_proxies_handler in bpy.app.handlers.save_post:
+        bpy.app.handlers.save_post.remove(_show_proxies_handler)
@@ -0,0 +1,117 @@
+# ##### BEGIN GPL LICENSE BLOCK #####
+# KeenTools for blender is a blender addon for using KeenTools in Blender.
+# Copyright (C) 2019  KeenTools
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+# ##### END GPL LICENSE BLOCK #####
+
+
+import logging
+from collections import OrderedDict
+
+from .. config import Config, get_main_settings, get_addon_preferences
+
+
+def _image_nbytes(image):
+    """ Estimated size of loaded image buffer """
+    if not image.has_data:
+        return 0
+    w, h = image.size[:2]
+    return w * h * 4 * (4 if image.is_float else 1)
+
+
+class FBImageResidency:
+    """ Camera images with loaded pixels are kept within memory budget.
+    Least recently used ones are released by Image.buffers_free,
+    Blender loads them again on next access """
+    _used = OrderedDict()  # image name -> None, least recent first
+    _pinned = None  # image of the camera in pin mode
+    _released = 0
+
+    @staticmethod
+    def budget():
+        try:
+            return get_addon_preferences().image_memory_budget * 1024 * 1024
+        except (KeyError, AttributeError):
+            return Config.image_memory_budget
+
+    @staticmethod
+    def _camera_images():
+        settings = get_main_settings()
+        res = {}
+        for head in settings.heads:
+            for camera in head.cameras:
+                if camera.cam_image is not None:
+                    res[camera.cam_image.name] = camera.cam_image
+        return res
+
+    @classmethod
+    def use(cls, image, pin=False):
+        """ Image pixels are needed now (pin mode or texture baking) """
+        if image is None:
+            return
+        cls._used[image.name] = None
+        cls._used.move_to_end(image.name)
+        if pin:
+            cls._pinned = image.name
+        cls.enforce_budget()
+
+    @classmethod
+    def unpin(cls):
+        cls._pinned = None
+
+    @classmethod
+    def _loaded_images(cls):
+        """ Loaded camera images, least recently used first.
+        Images loaded without use() call go before used ones """
+        images = cls._camera_images()
+        for name in [x for x in cls._used.keys() if x not in images]:
+            del cls._used[name]
+        used = [images[name] for name in cls._used.keys()]
+        other = [img for name, img in images.items() if name not in cls._used]
+        return [img for img in other + used if img.has_data]
+
+    @classmethod
+    def enforce_budget(cls):
+        logger = logging.getLogger(__name__)
+        loaded = cls._loaded_images()
+        total = sum(_image_nbytes(img) for img in loaded)
+        budget = cls.budget()
+        # The most recently used image is never released
+        for img in loaded[:-1]:
+            if total <= budget:
+                break
+            if img.name == cls._pinned:
+                continue
+            total -= _image_nbytes(img)
+            img.buffers_free()
+            cls._used.pop(img.name, None)
+            cls._released += 1
+            logger.debug('IMAGE BUFFERS FREE: {}'.format(img.name))
+
+    @classmethod
+    def release_all(cls):
+        for img in cls._loaded_images():
+            if img.name != cls._pinned:
+                img.buffers_free()
+                cls._released += 1
+        cls._used.clear()
+
+    @classmethod
+    def stats(cls):
+        loaded = cls._loaded_images()
+        return {'loaded': len(loaded),
+                'nbytes': sum(_image_nbytes(img) for img in loaded),
+                'budget': cls.budget(),
+                'released': cls._released}
@@ -0,0 +1,70 @@
+# ##### BEGIN GPL LICENSE BLOCK #####
+# KeenTools for blender is a blender addon for using KeenTools in Blender.
+# Copyright (C) 2019  KeenTools
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+# ##### END GPL LICENSE BLOCK #####
+
+
+import math
+
+import numpy as np
+
+
+class FBPointsGrid:
+    """ Uniform grid over 2D points for local queries """
+    def __init__(self, points, cell_size):
+        self.cell_size = cell_size
+        self.points = np.asarray(points, dtype=np.float32).reshape((-1, 2))
+        self._cells = {}
+        if len(self.points) == 0:
+            return
+        # Same float64 rounding as in queries
+        cells = np.floor(self.points.astype(np.float64) /
+                         cell_size).astype(np.int64)
+        order = np.lexsort((cells[:, 1], cells[:, 0]))
+        unique, starts = np.unique(cells[order], axis=0, return_index=True)
+        bounds = np.append(starts, len(order))
+        for i, cell in enumerate(unique.tolist()):
+            self._cells[tuple(cell)] = order[bounds[i]:bounds[i + 1]]
+
+    def candidates(self, x, y, radius):
+        """ Indices of points in cells touched by the query circle """
+        x1 = math.floor((x - radius) / self.cell_size)
+        x2 = math.floor((x + radius) / self.cell_size)
+        y1 = math.floor((y - radius) / self.cell_size)
+        y2 = math.floor((y + radius) / self.cell_size)
+        if (x2 - x1 + 1) * (y2 - y1 + 1) > len(self._cells):
+            # Query is wider than grid itself
+            found = list(self._cells.values())
+        else:
+            found = [self._cells[(cx, cy)]
+                     for cx in range(x1, x2 + 1)
+                     for cy in range(y1, y2 + 1) if (cx, cy) in self._cells]
+        if len(found) == 0:
+            return np.empty((0,), dtype=np.int64)
+        return np.concatenate(found)
+
+    def nearest(self, x, y, dist2):
+        """ Nearest point index closer than sqrt(dist2) and its squared
+        distance or (-1, dist2) """
+        candidates = self.candidates(x, y, math.sqrt(dist2))
+        if len(candidates) == 0:
+            return -1, dist2
+        points = self.points[candidates]
+        d2 = (points[:, 0] - x) ** 2 + (points[:, 1] - y) ** 2
+        nearest = int(np.argmin(d2))
+        if d2[nearest] < dist2:
+            return int(candidates[nearest]), float(d2[nearest])
+        return -1, dist2
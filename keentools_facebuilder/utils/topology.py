@@ -0,0 +1,87 @@
+# ##### BEGIN GPL LICENSE BLOCK #####
+# KeenTools for blender is a blender addon for using KeenTools in Blender.
+# Copyright (C) 2019  KeenTools
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+# ##### END GPL LICENSE BLOCK #####
+
+import logging
+from collections import OrderedDict
+
+import numpy as np
+
+from .. config import Config
+
+
+class FBMeshTopology:
+    """ Vertex independent part of head mesh """
+    def __init__(self, points_count, indices, loop_starts, loop_totals, uvs):
+        self.points_count = points_count
+        self.indices = np.ascontiguousarray(indices, dtype=np.int32)
+        self.loop_starts = np.ascontiguousarray(loop_starts, dtype=np.int32)
+        self.loop_totals = np.ascontiguousarray(loop_totals, dtype=np.int32)
+        self.uvs = np.ascontiguousarray(uvs, dtype=np.float32)
+
+    def nbytes(self):
+        return self.indices.nbytes + self.loop_starts.nbytes + \
+            self.loop_totals.nbytes + self.uvs.nbytes
+
+
+class FBTopologyCache:
+    """ Process-level LRU cache of head topologies.
+    Key is (model index, masks, uv set) """
+    _cache = OrderedDict()
+    _max_size = Config.topology_cache_size
+    _hits = 0
+    _misses = 0
+
+    @staticmethod
+    def make_key(model_index, masks, uv_set):
+        return model_index, tuple(bool(m) for m in masks), uv_set
+
+    @classmethod
+    def get(cls, key):
+        topology = cls._cache.get(key)
+        if topology is None:
+            cls._misses += 1
+            return None
+        cls._hits += 1
+        cls._cache.move_to_end(key)
+        return topology
+
+    @classmethod
+    def put(cls, key, topology):
+        logger = logging.getLogger(__name__)
+        cls._cache[key] = topology
+        cls._cache.move_to_end(key)
+        while len(cls._cache) > cls._max_size:
+            old_key, _ = cls._cache.popitem(last=False)
+            logger.debug('TOPOLOGY CACHE EVICT: {}'.format(old_key))
+
+    @classmethod
+    def clear(cls):
+        cls._cache.clear()
+
+    @classmethod
+    def set_max_size(cls, size):
+        cls._max_size = max(1, size)
+        while len(cls._cache) > cls._max_size:
+            cls._cache.popitem(last=False)
+
+    @classmethod
+    def stats(cls):
+        return {'entries': len(cls._cache),
+                'hits': cls._hits,
+                'misses': cls._misses,
+                'nbytes': sum(t.nbytes() for t in cls._cache.values())}
@@ -27,10 +27,13 @@ from . utils import coords
 from . utils.edges import FBEdgeShader3D, FBEdgeShader2D
 from . utils.other import FBText
 from . utils.points import FBPoints2D, FBPoints3D
+from . utils.spatial import FBPointsGrid
 
 
 class FBScreenPins:
-    _pins = []
+    """ Pins of current view in image space as float32 (N, 2) array """
+    _pins = np.empty((0, 2), dtype=np.float32)
+    _grid = None
     _current_pin = None
     _current_pin_num = -1
 
@@ -38,13 +41,50 @@ class FBScreenPins:
     def arr(cls):
         return cls._pins
 
+    @classmethod
+    def pins_count(cls):
+        return len(cls._pins)
+
     @classmethod
     def set_pins(cls, arr):
-        cls._pins = arr
+        cls._pins = np.array(arr, dtype=np.float32).reshape((-1, 2))
+        cls._grid = None
 
     @classmethod
     def add_pin(cls, vec2d):
-        cls._pins.append(vec2d)
+        cls._pins = np.append(
+            cls._pins, np.array([vec2d], dtype=np.float32), axis=0)
+        cls._grid = None
+
+    @classmethod
+    def set_pin(cls, index, vec2d):
+        cls._pins[index] = vec2d
+        cls._grid = None
+
+    @classmethod
+    def remove_pin(cls, index):
+        cls.remove_pins([index])
+
+    @classmethod
+    def remove_pins(cls, indices):
+        cls._pins = np.delete(cls._pins, indices, axis=0)
+        cls._grid = None
+
+    @classmethod
+    def _get_grid(cls):
+        if len(cls._pins) < Config.pins_grid_threshold:
+            return None
+        if cls._grid is None:
+            cls._grid = FBPointsGrid(cls._pins, Config.pins_grid_cell_size)
+        return cls._grid
+
+    @classmethod
+    def nearest(cls, x, y, dist2):
+        """ Nearest pin index closer than sqrt(dist2) or -1 """
+        grid = cls._get_grid()
+        if grid is None or not np.isfinite(dist2):
+            return coords.nearest_point(x, y, cls._pins, dist2)
+        return grid.nearest(x, y, dist2)
 
     @classmethod
     def current_pin_num(cls):
@@ -93,6 +133,12 @@ class FBViewport:
 
     _residuals = FBEdgeShader2D()
 
+    # Special face parts edges (vertex pairs)
+    _special_indices_array = None
+
+    # Residual statistics by keyframe
+    _residual_stats = {}
+
     # Pins
     _pins = FBScreenPins()
 
@@ -199,36 +245,39 @@ class FBViewport:
 
     @classmethod
     def update_wireframe(cls, obj):
-        logger = logging.getLogger(__name__)
         settings = get_main_settings()
-        main_color = settings.wireframe_color
-        comp_color = settings.wireframe_special_color
-
-        cls.wireframer().init_color_data((*main_color,
-                                          settings.wireframe_opacity))
-        if settings.show_specials:
-            mesh = obj.data
-            # Check to prevent shader problem
-            if len(mesh.edges) * 2 == len(cls.wireframer().edges_colors):
-                logger.debug("COLORING")
-                special_indices = cls.get_special_indices()
-                cls.wireframer().init_special_areas(
-                    obj.data, special_indices, (*comp_color,
-                                                settings.wireframe_opacity))
-            else:
-                logging.warning("LISTS HAVE DIFFERENT SIZES")
+        main_color = (*settings.wireframe_color, settings.wireframe_opacity)
+        special_color = (*settings.wireframe_special_color,
+                         settings.wireframe_opacity)
+        cls.init_wireframe_colors(main_color, special_color)
         cls.wireframer().create_batches()
 
     @classmethod
-    def get_special_indices(cls):
-        pairs = const.get_eyes_indices()
-        pairs = pairs.union(const.get_eyebrows_indices())
-        pairs = pairs.union(const.get_nose_indices())
-        pairs = pairs.union(const.get_mouth_indices())
-        pairs = pairs.union(const.get_ears_indices())
-        pairs = pairs.union(const.get_half_indices())
-        # pairs = pairs.union(const.get_jaw_indices2())
-        return pairs
+    def init_wireframe_colors(cls, main_color, special_color):
+        logger = logging.getLogger(__name__)
+        settings = get_main_settings()
+        wireframer = cls.wireframer()
+        if not settings.show_specials:
+            wireframer.init_color_data(main_color)
+            return
+
+        if wireframer.special_edges_mask is None:
+            logger.debug("SPECIAL EDGES MASK")
+            wireframer.init_special_edges_mask(cls.get_special_indices_array())
+        wireframer.init_color_data(main_color, special_color)
+
+    @classmethod
+    def _special_parts(cls):
+        # 'jaw2' is not in use
+        return 'eyes', 'eyebrows', 'nose', 'mouth', 'ears', 'half'
+
+    @classmethod
+    def get_special_indices_array(cls):
+        if cls._special_indices_array is None:
+            cls._special_indices_array = np.concatenate(
+                [const.get_indices_array(name)
+                 for name in cls._special_parts()])
+        return cls._special_indices_array
 
     @classmethod
     def update_pin_sensitivity(cls):
@@ -242,32 +291,45 @@ class FBViewport:
         cls.points3d().set_point_size(
             settings.pin_size * Config.surf_pin_size_scale)
 
+    @classmethod
+    def _surface_points_data(cls, fb, keyframes):
+        """ Pins geo_point_idxs and barycentric coordinates as arrays """
+        geo_point_idxs = []
+        barycentric = []
+        pins_keyframes = []
+        for k in keyframes:
+            for i in range(fb.pins_count(k)):
+                sp = fb.pin(k, i).surface_point
+                geo_point_idxs.append(sp.geo_point_idxs)
+                barycentric.append(sp.barycentric_coordinates)
+                pins_keyframes.append(k)
+        return np.array(geo_point_idxs, dtype=np.int32).reshape((-1, 3)), \
+            np.array(barycentric, dtype=np.float32).reshape((-1, 3)), \
+            np.array(pins_keyframes, dtype=np.int32)
+
+    @classmethod
+    def _surface_points_xyz(cls, headobj, geo_point_idxs, barycentric):
+        if len(geo_point_idxs) == 0:
+            return np.empty((0, 3), dtype=np.float32)
+        verts = coords.get_mesh_verts(headobj.data)
+        return coords.barycentric_to_xyz(verts, geo_point_idxs, barycentric)
+
     @classmethod
     def surface_points(cls, fb, headobj, keyframe=-1,
                        allcolor=(0, 0, 1, 0.15), selcolor=(0, 1, 0, 1)):
-        verts = []
-        colors = []
-
-        for k in fb.keyframes():
-            for i in range(fb.pins_count(k)):
-                pin = fb.pin(k, i)
-                p = coords.pin_to_xyz(pin, headobj)
-                verts.append(p)
-                if k == keyframe:
-                    colors.append(selcolor)
-                else:
-                    colors.append(allcolor)
+        geo_point_idxs, barycentric, pins_keyframes = \
+            cls._surface_points_data(fb, fb.keyframes())
+        verts = cls._surface_points_xyz(headobj, geo_point_idxs, barycentric)
+        colors = np.where((pins_keyframes == keyframe)[:, np.newaxis],
+                          np.array(selcolor, dtype=np.float32),
+                          np.array(allcolor, dtype=np.float32))
         return verts, colors
 
     @classmethod
     def surface_points_only(cls, fb, headobj, keyframe=-1):
-        verts = []
-
-        for i in range(fb.pins_count(keyframe)):
-            pin = fb.pin(keyframe, i)
-            p = coords.pin_to_xyz(pin, headobj)
-            verts.append(p)
-        return verts
+        geo_point_idxs, barycentric, _ = \
+            cls._surface_points_data(fb, (keyframe,))
+        return cls._surface_points_xyz(headobj, geo_point_idxs, barycentric)
 
     @classmethod
     def img_points(cls, fb, keyframe):
@@ -287,7 +349,8 @@ class FBViewport:
     @classmethod
     def create_batch_2d(cls, context):
         """ Main Pin Draw Batch"""
-        points = cls.pins().arr().copy()
+        pins = cls.pins()
+        pins_count = pins.pins_count()
 
         scene = context.scene
         rx = scene.render.resolution_x
@@ -296,29 +359,20 @@ class FBViewport:
 
         x1, y1, x2, y2 = coords.get_camera_border(context)
 
-        for i, p in enumerate(points):
-            x, y = coords.image_space_to_region(p[0], p[1], x1, y1, x2, y2)
-            points[i] = (x, y)
+        # Pins and two camera corners
+        points = np.empty((pins_count + 2, 2), dtype=np.float32)
+        points[:pins_count] = pins.arr()
+        points[pins_count:] = ((-0.5, -asp * 0.5), (0.5, asp * 0.5))
+        points[:, 0], points[:, 1] = coords.image_space_to_region(
+            points[:, 0], points[:, 1], x1, y1, x2, y2)
 
-        vertex_colors = [Config.pin_color for _ in range(len(points))]
+        vertex_colors = np.empty((pins_count + 2, 4), dtype=np.float32)
+        vertex_colors[:pins_count] = Config.pin_color
+        vertex_colors[pins_count:] = (1.0, 0.0, 1.0, 0.2)  # camera corners
 
-        pins = cls.pins()
-        if pins.current_pin() and pins.current_pin_num() < len(vertex_colors):
+        if pins.current_pin() and pins.current_pin_num() < pins_count:
             vertex_colors[pins.current_pin_num()] = Config.current_pin_color
 
-        # Camera corners
-        points.append(
-            (coords.image_space_to_region(
-                -0.5, -asp * 0.5, x1, y1, x2, y2))
-        )
-        points.append(
-            (coords.image_space_to_region(
-                0.5, asp * 0.5,
-                x1, y1, x2, y2))
-        )
-        vertex_colors.append((1.0, 0.0, 1.0, 0.2))  # left camera corner
-        vertex_colors.append((1.0, 0, 1.0, 0.2))  # right camera corner
-
         cls.points2d().set_vertices_colors(points, vertex_colors)
         cls.points2d().create_batch()
 
@@ -330,7 +384,8 @@ class FBViewport:
 
         x1, y1, x2, y2 = coords.get_camera_border(context)
 
-        p2d = cls.img_points(fb, keyframe)
+        p2d = np.array(cls.img_points(fb, keyframe),
+                       dtype=np.float32).reshape((-1, 2))
         p3d = cls.surface_points_only(fb, headobj, keyframe)
 
         wire = cls.residuals()
@@ -343,6 +398,7 @@ class FBViewport:
             return
 
         if len(p3d) == 0:
+            cls._residual_stats.pop(keyframe, None)
             # Empty shader
             wire.create_batch()
             return
@@ -363,21 +419,46 @@ class FBViewport:
             headobj.matrix_world.transposed() @ m.transposed()) @ projection
         # Calc projection
         vv = vv @ transform
-        vv = (vv.T / vv[:, 3]).T
-
-        verts2 = []
-        for i, v in enumerate(vv):
-            x, y = coords.frame_to_image_space(v[0], v[1], rx, ry)
-            verts2.append(coords.image_space_to_region(x, y,
-                                                       x1, y1, x2, y2))
-            wire.edge_lengths.append(0)
-            verts2.append(coords.image_space_to_region(p2d[i][0], p2d[i][1],
-                                                       x1, y1, x2, y2))
-            # length = np.linalg.norm((v[0]-p2d[i][0], v[1]-p2d[i][1]))
-            length = 22.0
-            wire.edge_lengths.append(length)
-
-        wire.vertices = verts2
-        wire.vertices_colors = np.full((len(verts2), 4),
-                                       Config.residual_color).tolist()
+        vv = vv[:, :2] / vv[:, 3:4]
+
+        # Projected surface points in image space
+        projected = np.empty_like(p2d)
+        projected[:, 0], projected[:, 1] = coords.frame_to_image_space(
+            vv[:, 0], vv[:, 1], rx, ry)
+
+        # Interleaved edges: projected point -> pin
+        edges = np.empty((len(p2d) * 2, 2), dtype=np.float32)
+        edges[0::2, 0], edges[0::2, 1] = coords.image_space_to_region(
+            projected[:, 0], projected[:, 1], x1, y1, x2, y2)
+        edges[1::2, 0], edges[1::2, 1] = coords.image_space_to_region(
+            p2d[:, 0], p2d[:, 1], x1, y1, x2, y2)
+
+        # Dash pattern is calculated by length in region pixels
+        lengths = np.zeros(len(edges), dtype=np.float32)
+        lengths[1::2] = np.linalg.norm(edges[1::2] - edges[0::2], axis=1)
+
+        # Image space is normalized by frame width
+        cls._residual_stats[keyframe] = cls._calc_residual_stats(
+            np.linalg.norm(p2d - projected, axis=1) * rx)
+
+        wire.vertices = edges
+        wire.edge_lengths = lengths
+        wire.vertices_colors = np.full((len(edges), 4), Config.residual_color,
+                                       dtype=np.float32)
         wire.create_batch()
+
+    @staticmethod
+    def _calc_residual_stats(residuals):
+        """ Residuals in frame pixels """
+        return {'count': len(residuals),
+                'mean': float(np.mean(residuals)),
+                'max': float(np.max(residuals)),
+                'rms': float(np.sqrt(np.mean(residuals ** 2)))}
+
+    @classmethod
+    def residual_stats(cls, keyframe):
+        return cls._residual_stats.get(keyframe)
+
+    @classmethod
+    def reset_residual_stats(cls):
+        cls._residual_stats = {}
@@ -0,0 +1,425 @@
+# -------
+# KeenTools for Blender performance benchmarks
+# start it from commandline:
+# blender -b -P /full_path_to/benchmarks.py
+# or with selected benchmarks only:
+# blender -b -P /full_path_to/benchmarks.py -- mesh
+# -------
+import os
+import shutil
+import sys
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+import tempfile
+import time
+
+import bpy
+import numpy as np
+
+from keentools_facebuilder.fbloader import FBLoader
+from keentools_facebuilder.settings import FBCameraItem
+from keentools_facebuilder.utils import head_state, color
+from keentools_facebuilder.utils.images import (
+    FBImageBufferPool, image_to_array, rotate_view)
+from keentools_facebuilder.utils.topology import FBTopologyCache
+
+
+def _timeit(func, repeat=3):
+    best = None
+    res = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        res = func()
+        delta = time.perf_counter() - start
+        best = delta if best is None else min(best, delta)
+    return best, res
+
+
+def _report(name, *rows):
+    print('--- {} ---'.format(name))
+    for title, value in rows:
+        print('{:>32}: {}'.format(title, value))
+
+
+def _peak_rss_mb():
+    if resource is None:
+        return float('nan')
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS reports bytes
+    return rss / (1024 * 1024) if sys.platform == 'darwin' else rss / 1024
+
+
+# --------
+# Mesh construction
+def _legacy_builder_mesh(builder, mesh_name):
+    """ Per-element mesh creation (used before bulk foreach_set) """
+    me = builder.applied_args_model().mesh(0)
+
+    vertices = [me.point(i) for i in range(me.points_count())]
+    rot = np.array([[1., 0., 0.], [0., 0., 1.], [0., -1., 0]])
+    vertices2 = vertices @ rot
+
+    faces = []
+    for i in range(me.faces_count()):
+        row = []
+        for j in range(me.face_size(i)):
+            row.append(me.face_point(i, j))
+        faces.append(tuple(row))
+
+    mesh = bpy.data.meshes.new(mesh_name)
+    mesh.from_pydata(vertices2, [], faces)
+    values = [True] * len(mesh.polygons)
+    mesh.polygons.foreach_set('use_smooth', values)
+
+    uvmap = mesh.uv_layers.new().data
+    for i in range(me.uvs_count()):
+        uvmap[i].uv = me.uv(i)
+    mesh.update()
+    return mesh
+
+
+def benchmark_mesh():
+    builder = FBLoader.new_builder()
+
+    def _legacy():
+        return _legacy_builder_mesh(builder, 'bench_legacy_mesh')
+
+    def _bulk():
+        FBTopologyCache.clear()
+        return FBLoader.get_builder_mesh(builder, 'bench_bulk_mesh')
+
+    def _cached():
+        return FBLoader.get_builder_mesh(builder, 'bench_cached_mesh')
+
+    legacy_time, legacy_mesh = _timeit(_legacy)
+    bulk_time, bulk_mesh = _timeit(_bulk)
+    cached_time, _ = _timeit(_cached)
+
+    legacy_co = np.empty(len(legacy_mesh.vertices) * 3, dtype=np.float32)
+    legacy_mesh.vertices.foreach_get('co', legacy_co)
+    bulk_co = np.empty(len(bulk_mesh.vertices) * 3, dtype=np.float32)
+    bulk_mesh.vertices.foreach_get('co', bulk_co)
+
+    _report('get_builder_mesh (stock topology)',
+            ('vertices / polygons', '{} / {}'.format(
+                len(bulk_mesh.vertices), len(bulk_mesh.polygons))),
+            ('legacy', '{:.4f} s'.format(legacy_time)),
+            ('bulk', '{:.4f} s'.format(bulk_time)),
+            ('bulk, topology cache hit', '{:.4f} s'.format(cached_time)),
+            ('speedup', '{:.1f}x'.format(legacy_time / bulk_time)),
+            ('same geometry', np.allclose(legacy_co, bulk_co) and
+             len(legacy_mesh.edges) == len(bulk_mesh.edges)))
+
+    for mesh in list(bpy.data.meshes):
+        if mesh.name.startswith('bench_'):
+            bpy.data.meshes.remove(mesh)
+
+
+# --------
+# Special edges tables
+def _write_legacy_const_module(filepath, tables):
+    """ Python set literals module as const.py was before npz storage """
+    with open(filepath, 'w') as f:
+        for name, arr in tables.items():
+            f.write('def get_{}_indices():\n    return {{\n'.format(name))
+            for a, b in arr.tolist():
+                f.write('({}, {}),\n'.format(a, b))
+            f.write('        }\n\n\n')
+
+
+def benchmark_const():
+    from keentools_facebuilder import const
+
+    def _load_npz():
+        const._indices_arrays = None
+        const._indices_sets.clear()
+        return {name: const.get_indices_array(name)
+                for name in const._load_indices_arrays().keys()}
+
+    npz_time, tables = _timeit(_load_npz)
+
+    legacy_path = os.path.join(tempfile.mkdtemp(), 'legacy_const.py')
+    _write_legacy_const_module(legacy_path, tables)
+
+    def _compile_legacy():
+        with open(legacy_path) as f:
+            code = compile(f.read(), legacy_path, 'exec')
+        namespace = {}
+        exec(code, namespace)
+        return namespace
+
+    legacy_time, _ = _timeit(_compile_legacy)
+    set_time, _ = _timeit(lambda: [const.get_indices_set(name)
+                                   for name in tables.keys()])
+
+    _report('special edges tables (startup)',
+            ('pairs total', sum(len(arr) for arr in tables.values())),
+            ('legacy .py compile + exec', '{:.4f} s'.format(legacy_time)),
+            ('npz load', '{:.4f} s'.format(npz_time)),
+            ('memoized set access', '{:.6f} s'.format(set_time)),
+            ('npz size', '{} bytes'.format(
+                os.path.getsize(const._INDICES_FILE))),
+            ('legacy size', '{} bytes'.format(os.path.getsize(legacy_path))))
+    os.remove(legacy_path)
+
+
+# --------
+# Head state storage
+def benchmark_head_state():
+    builder = FBLoader.new_builder()
+    serial_str = builder.serialize()
+    mat = np.random.rand(4, 4).astype(np.float32)
+    repeat = 1000
+
+    def _serial_legacy():
+        return serial_str.encode('utf-8').decode('utf-8')
+
+    def _serial_blob():
+        return head_state.unpack_serial(head_state.pack_serial(serial_str))
+
+    def _mat_legacy():
+        for _ in range(repeat):
+            FBCameraItem.convert_str_to_matrix(
+                FBCameraItem.convert_matrix_to_str(mat))
+
+    def _mat_blob():
+        for _ in range(repeat):
+            head_state.unpack_matrix(head_state.pack_matrix(mat))
+
+    serial_legacy_time, _ = _timeit(_serial_legacy)
+    serial_blob_time, unpacked = _timeit(_serial_blob)
+    mat_legacy_time, _ = _timeit(_mat_legacy)
+    mat_blob_time, _ = _timeit(_mat_blob)
+
+    _report('head state storage',
+            ('serial str size', '{} bytes'.format(len(serial_str))),
+            ('serial blob size', '{} bytes'.format(
+                len(head_state.pack_serial(serial_str)))),
+            ('serial str round-trip', '{:.6f} s'.format(serial_legacy_time)),
+            ('serial blob round-trip', '{:.6f} s'.format(serial_blob_time)),
+            ('serial identical', unpacked == serial_str),
+            ('matrix hex size', '{} bytes'.format(
+                len(FBCameraItem.convert_matrix_to_str(mat)))),
+            ('matrix raw size', '{} bytes'.format(
+                len(head_state.pack_matrix(mat)))),
+            ('matrix hex x{}'.format(repeat),
+             '{:.4f} s'.format(mat_legacy_time)),
+            ('matrix raw x{}'.format(repeat),
+             '{:.4f} s'.format(mat_blob_time)))
+
+
+# --------
+# Camera image pixels extraction (texture baking input)
+def benchmark_pixels(width=4000, height=3000):
+    img = bpy.data.images.new('bench_pixels', width=width, height=height,
+                              alpha=True, float_buffer=False)
+
+    def _legacy():
+        return np.rot90(np.asarray(img.pixels[:]).reshape((height, width, 4)),
+                        1)
+
+    def _buffer():
+        res = rotate_view(image_to_array(img), 1)
+        FBImageBufferPool.release(res.base)
+        return res
+
+    # Peak RSS only grows, so lighter method goes first
+    rss_start = _peak_rss_mb()
+    buffer_time, buffer_res = _timeit(_buffer)
+    rss_buffer = _peak_rss_mb()
+    legacy_time, legacy_res = _timeit(_legacy, repeat=1)
+    rss_legacy = _peak_rss_mb()
+
+    _report('camera image pixels {}x{}'.format(width, height),
+            ('legacy pixels[:]', '{:.4f} s'.format(legacy_time)),
+            ('foreach_get to pool buffer', '{:.4f} s'.format(buffer_time)),
+            ('peak RSS at start', '{:.0f} MB'.format(rss_start)),
+            ('peak RSS after foreach_get', '{:.0f} MB'.format(rss_buffer)),
+            ('peak RSS after legacy', '{:.0f} MB'.format(rss_legacy)),
+            ('same pixels', np.allclose(legacy_res, buffer_res)))
+
+    FBImageBufferPool.clear()
+    bpy.data.images.remove(img)
+
+
+def benchmark_bake(width=6000, height=4000, cameras_count=3):
+    sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+    import test_utils
+    from keentools_facebuilder.config import get_main_settings
+    from keentools_facebuilder.utils import coords, materials
+
+    test_utils.new_scene()
+    test_utils.create_head()
+    settings = get_main_settings()
+    headnum = settings.get_last_headnum()
+    for _ in range(cameras_count):
+        test_utils.create_empty_camera(headnum)
+
+    brect = tuple(coords.get_camera_border(bpy.context))
+    arect = (396.5, -261.9, 1189.5, 1147.9)
+    head = settings.get_head(headnum)
+    for camnum, camera in enumerate(head.cameras):
+        test_utils.select_camera(headnum, camnum)
+        test_utils.move_pin(793, 421, 651, 425, arect, brect,
+                            headnum, camnum)
+        test_utils.update_pins(headnum, camnum)
+        # Generated image has no file, so bake cache is not used
+        camera.cam_image = bpy.data.images.new(
+            'bench_bake_{}'.format(camnum), width=width, height=height,
+            alpha=True, float_buffer=False)
+    test_utils.out_pinmode()
+
+    rss_start = _peak_rss_mb()
+    tex_name = 'bench_bake_texture'
+    bake_time, texture_baked = _timeit(
+        lambda: materials.bake_tex(headnum, tex_name), repeat=1)
+    rss_bake = _peak_rss_mb()
+
+    _report('texture bake, {} cameras {}x{}'.format(
+                cameras_count, width, height),
+            ('bake', '{:.2f} s'.format(bake_time)),
+            ('bake_tex result', texture_baked),
+            ('texture created', bpy.data.images.get(tex_name) is not None),
+            ('peak RSS at start', '{:.0f} MB'.format(rss_start)),
+            ('peak RSS after bake', '{:.0f} MB'.format(rss_bake)),
+            ('pool buffers', '{:.0f} MB'.format(
+                FBImageBufferPool.nbytes() / (1024 * 1024))))
+    FBImageBufferPool.clear()
+
+
+# --------
+# sRGB to linear conversion
+def _legacy_sRGB_to_linear(img):
+    img_rgb = img[:, :, :3]
+    img_rgb[img_rgb < 0.04045] = 25 * img_rgb[img_rgb < 0.04045] / 323
+    img_rgb[img_rgb >= 0.04045] = \
+        ((200 * img_rgb[img_rgb >= 0.04045] + 11) / 211) ** (12 / 5)
+    return img
+
+
+def benchmark_srgb():
+    rng = np.random.RandomState(0)
+    for name, (width, height) in (('4K', (3840, 2160)), ('8K', (7680, 4320))):
+        src = rng.randint(0, 256, (height, width, 4)).astype(np.float32) / 255
+        img = np.empty_like(src)
+
+        def _run(func):
+            def _func():
+                img[...] = src
+                start = time.perf_counter()
+                func(img)
+                return time.perf_counter() - start
+            # Buffer copy is not measured
+            return min(_func() for _ in range(3))
+
+        legacy_time = _run(_legacy_sRGB_to_linear)
+        lut8_time = _run(lambda x: color.srgb_to_linear(x, is_8bit=True))
+        lut_time = _run(lambda x: color.srgb_to_linear(x, is_8bit=False))
+        mpix = width * height / 1e6
+
+        _report('sRGB to linear {} ({:.1f} MP)'.format(name, mpix),
+                ('legacy formula', '{:.1f} MP/s'.format(mpix / legacy_time)),
+                ('8-bit LUT', '{:.1f} MP/s'.format(mpix / lut8_time)),
+                ('4096 LUT interpolation', '{:.1f} MP/s'.format(
+                    mpix / lut_time)))
+
+
+# --------
+# EXIF reading
+def benchmark_exif():
+    from keentools_facebuilder.blender_independent_packages import exifread
+    from keentools_facebuilder.utils.exif_reader import _EXIF_TAGS
+
+    images_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                              'images')
+    repeat = 100
+
+    def _full(filepath):
+        with open(filepath, 'rb') as f:
+            return exifread.process_file(f, details=True)
+
+    def _fast(filepath):
+        with open(filepath, 'rb') as f:
+            return exifread.process_file_tags(f, _EXIF_TAGS)
+
+    rows = []
+    for name in sorted(os.listdir(images_dir)):
+        filepath = os.path.join(images_dir, name)
+        full_time, _ = _timeit(
+            lambda: [_full(filepath) for _ in range(repeat)])
+        fast_time, _ = _timeit(
+            lambda: [_fast(filepath) for _ in range(repeat)])
+        rows.append((name, 'full {:.3f} ms, tags {:.3f} ms'.format(
+            1000 * full_time / repeat, 1000 * fast_time / repeat)))
+    _report('EXIF per file', *rows)
+
+
+# --------
+# Multiple images import EXIF ingestion
+def _make_jpeg_folder(count):
+    images_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                              'images')
+    sources = [os.path.join(images_dir, name)
+               for name in sorted(os.listdir(images_dir))
+               if name.endswith('.jpg') and
+               os.path.getsize(os.path.join(images_dir, name)) > 0]
+    folder = tempfile.mkdtemp(prefix='bench_exif_import_')
+    filepaths = []
+    for i in range(count):
+        filepath = os.path.join(folder, 'img_{:04d}.jpg'.format(i))
+        shutil.copyfile(sources[i % len(sources)], filepath)
+        filepaths.append(filepath)
+    return folder, filepaths
+
+
+def benchmark_exif_import(count=200):
+    from keentools_facebuilder.config import Config
+    from keentools_facebuilder.utils.exif_reader import read_exif_batch
+
+    def _cold(workers):
+        # New folder each time, so EXIF cache has no entries for it
+        folder, filepaths = _make_jpeg_folder(count)
+        start = time.perf_counter()
+        res = read_exif_batch(filepaths, workers=workers)
+        delta = time.perf_counter() - start
+        shutil.rmtree(folder)
+        return delta, res
+
+    serial_time, serial_res = _cold(1)
+    pool_time, pool_res = _cold(Config.exif_import_workers)
+
+    folder, filepaths = _make_jpeg_folder(count)
+    read_exif_batch(filepaths)
+    warm_time, _ = _timeit(lambda: read_exif_batch(filepaths))
+    shutil.rmtree(folder)
+
+    def _strip(res):
+        return [{k: v for k, v in data.items() if k != 'filepath'}
+                for data in res]
+
+    _report('EXIF ingestion of {} JPEG files'.format(count),
+            ('serial', '{:.4f} s'.format(serial_time)),
+            ('thread pool x{}'.format(Config.exif_import_workers),
+             '{:.4f} s'.format(pool_time)),
+            ('thread pool, cache hit', '{:.4f} s'.format(warm_time)),
+            ('same EXIF data', _strip(serial_res) == _strip(pool_res)))
+
+
+BENCHMARKS = {
+    'mesh': benchmark_mesh,
+    'const': benchmark_const,
+    'head_state': benchmark_head_state,
+    'pixels': benchmark_pixels,
+    'bake': benchmark_bake,
+    'srgb': benchmark_srgb,
+    'exif': benchmark_exif,
+    'exif_import': benchmark_exif_import,
+}
+
+
+if __name__ == "__main__":
+    argv = sys.argv[sys.argv.index('--') + 1:] if '--' in sys.argv else []
+    for name in (argv if argv else BENCHMARKS.keys()):
+        BENCHMARKS[name]()
@@ -15,7 +15,11 @@ import test_utils
 # import tests.test_utils as test_utils
 
 
-from keentools_facebuilder.utils import coords, materials
+import numpy as np
+
+from keentools_facebuilder.utils import coords, materials, color
+from keentools_facebuilder.utils.image_groups import FBImageGroupIndex
+from keentools_facebuilder.utils import proxy
 from keentools_facebuilder.config import Config, get_main_settings, \
     get_operators
 
@@ -160,7 +164,125 @@ class FaceBuilderTest(unittest.TestCase):
         self.assertTrue(tex_name is not None)
 
 
+class ColorConversionTest(unittest.TestCase):
+    @staticmethod
+    def _legacy_sRGB_to_linear(img):
+        """ Formula used in texture baking before LUT conversion """
+        img_rgb = img[:, :, :3]
+        img_rgb[img_rgb < 0.04045] = 25 * img_rgb[img_rgb < 0.04045] / 323
+        img_rgb[img_rgb >= 0.04045] = \
+            ((200 * img_rgb[img_rgb >= 0.04045] + 11) / 211) ** (12 / 5)
+        return img
+
+    def test_8bit_lut(self):
+        rng = np.random.RandomState(0)
+        img = rng.randint(0, 256, (64, 48, 4)).astype(np.float32) / 255
+        expected = self._legacy_sRGB_to_linear(img.astype(np.float64))
+        res = color.srgb_to_linear(img.copy(), is_8bit=True, chunk_rows=5)
+        self.assertTrue(np.allclose(res, expected, rtol=0, atol=1e-6))
+
+    def test_float_lut(self):
+        rng = np.random.RandomState(1)
+        img = rng.uniform(-0.1, 1.5, (64, 48, 4)).astype(np.float32)
+        expected = self._legacy_sRGB_to_linear(img.astype(np.float64))
+        res = color.srgb_to_linear(img.copy(), is_8bit=False, chunk_rows=7)
+        self.assertTrue(np.allclose(res, expected, rtol=0, atol=1e-5))
+        # Alpha is untouched
+        self.assertTrue(np.array_equal(res[:, :, 3], img[:, :, 3]))
+
+    def test_rotated_view(self):
+        rng = np.random.RandomState(2)
+        img = rng.randint(0, 256, (30, 20, 4)).astype(np.float32) / 255
+        expected = np.rot90(
+            self._legacy_sRGB_to_linear(img.astype(np.float64)), 1)
+        view = np.rot90(img, 1)
+        res = color.srgb_to_linear(view, is_8bit=True, chunk_rows=3)
+        self.assertTrue(np.allclose(res, expected, rtol=0, atol=1e-6))
+
+
+class ImageGroupIndexTest(unittest.TestCase):
+    @staticmethod
+    def _partition(groups):
+        members = {}
+        for i, g in enumerate(groups):
+            if g > 0:
+                members.setdefault(g, []).append(i)
+        return sorted(members.values())
+
+    def test_add_and_remove(self):
+        index = FBImageGroupIndex()
+        index.build([], [], [])
+        for h in ('a', None, 'b', 'a', 'b', 'a', 'c'):
+            index.add(h, '4000:3000')
+        self.assertEqual([[0, 3, 5], [2, 4]], self._partition(index.groups))
+        self.assertEqual(0, index.groups[1])
+        self.assertEqual(0, index.groups[6])
+        self.assertTrue(index.show_groups())
+
+        changes = index.remove(2)  # 'b' group has one camera left
+        self.assertEqual({3: 0}, changes)
+        self.assertEqual([[0, 2, 4]], self._partition(index.groups))
+        self.assertEqual({'b': 3, 'c': 5}, index.singles)
+
+        index.add('c', '4000:3000')
+        self.assertEqual([[0, 2, 4], [5, 6]], self._partition(index.groups))
+
+    def test_update_and_manual_groups(self):
+        index = FBImageGroupIndex()
+        index.build([1, 1, 0, -1], ['a', 'a', 'b', 'b'],
+                    ['4000:3000', '4000:3000', '640:480', '640:480'])
+        self.assertTrue(index.is_size_compatible('4000:3000', 1))
+        self.assertFalse(index.is_size_compatible('640:480', 1))
+        self.assertTrue(index.is_size_compatible('640:480', 2))
+
+        # Image of camera 1 is replaced, it stays in its group
+        index.update(1, 'b', '4000:3000')
+        self.assertEqual([1, 1, 0, -1], index.groups)
+        # Reset moves it to camera 2 with the same hash
+        changes = index.update(1, 'b', '640:480', reset=True)
+        # and group 1 with one camera left is dissolved
+        self.assertEqual({0: 0, 1: 1, 2: 1}, changes)
+        self.assertEqual([0, 1, 1, -1], index.groups)
+
+        self.assertEqual(2, index.new_group())
+        index.set_group(0, 2)
+        index.set_group(3, 2)
+        self.assertEqual({1: 2, 2: 2}, index.counts)
+        index.set_group(0, -1)
+        self.assertEqual({1: 2, 2: 1}, index.counts)
+
+
+class ProxyTest(unittest.TestCase):
+    def test_proxy_size(self):
+        self.assertIsNone(proxy.proxy_size(2048, 1536, 2048))
+        self.assertEqual((2048, 1366), proxy.proxy_size(7952, 5304, 2048))
+        self.assertEqual((1366, 2048), proxy.proxy_size(5304, 7952, 2048))
+
+    def test_proxy_image(self):
+        img = bpy.data.images.new('proxy_source', width=4096, height=3072)
+        filepath = os.path.join(proxy.proxy_dir(), 'proxy_source.png')
+        os.makedirs(proxy.proxy_dir(), exist_ok=True)
+        img.filepath_raw = filepath
+        img.file_format = 'PNG'
+        img.save()
+        img.source = 'FILE'
+
+        res = proxy.get_proxy_image(img, 2048)
+        self.assertEqual((2048, 1536), tuple(res.size))
+        # Proxy file is reused
+        self.assertEqual(res, proxy.get_proxy_image(img, 2048))
+        self.assertIsNone(proxy.get_proxy_image(img, 4096))
+        self.assertTrue(proxy.is_proxy_image(res))
+        self.assertFalse(proxy.is_proxy_image(None))
+
+
 if __name__ == "__main__":
     # unittest.main()  # -- Doesn't work with Blender, so we use Suite
     suite = unittest.defaultTestLoader.loadTestsFromTestCase(FaceBuilderTest)
+    suite.addTests(
+        unittest.defaultTestLoader.loadTestsFromTestCase(ColorConversionTest))
+    suite.addTests(
+        unittest.defaultTestLoader.loadTestsFromTestCase(ImageGroupIndexTest))
+    suite.addTests(
+        unittest.defaultTestLoader.loadTestsFromTestCase(ProxyTest))
     unittest.TextTestRunner().run(suite)